@@ -287,59 +287,343 @@ D2L Date Processor - Bulk Date Assignment Editor with CSV Support
 Reads assignment names and dates from a CSV file and automatically updates them in D2L.
 """
 
-import time
+import tempfile
 import logging
+from datetime import datetime
+import logging.handlers
+import re
 import os
-import subprocess
-import shutil
 import csv
+import queue
 import threading
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException)
+
+# Compiled once at import: these run for every assignment and every candidate
+# link during name matching, so per-call re.sub recompilation adds up on
+# courses with hundreds of assignments.
+_DASH_RE = re.compile(r'[-–—−]')
+# Single-pass test for date-like link text ("8/29/2025 11:59 PM", etc.);
+# replaces scanning the string once per candidate substring
+_DATE_RE = re.compile(r'202[5-9]|/|[AP]M')
+# CSV date/time field formats: "8/29/2025" and "11:59 PM" / "23:59" / "11 PM"
+_DATE_MDY_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+_TIME_RE = re.compile(r'^(\d{1,2})(?::(\d{1,2}))?\s*([AP]M)?$', re.IGNORECASE)
+_COMMA_RE = re.compile(r',\s*')
+_WS_RE = re.compile(r'\s+')
+# Chromedriver binary path resolved by ChromeDriverManager on the first
+# setup_driver call; reused for later drivers in the same process
+_DRIVER_PATH = None
+# Sidecar record of the chromedriver PID from the last setup_driver, so the
+# next startup can kill exactly that process instead of sweeping by name
+_PIDFILE = os.path.join(tempfile.gettempdir(), "d2l_chromedriver.pid")
+# Emoji and emoji-related Unicode ranges stripped from assignment names
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
+    "\U0001F680-\U0001F6FF"  # Transport and Map
+    "\U0001F1E0-\U0001F1FF"  # Flags
+    "\U00002702-\U000027B0"  # Dingbats
+    "\U000024C2-\U0001F251"  # Enclosed characters
+    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+    "\U0001FA00-\U0001FA6F"  # Chess Symbols
+    "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+    "\U00002600-\U000026FF"  # Miscellaneous Symbols
+    "\U00002700-\U000027BF"  # Dingbats
+    "\U0000FE00-\U0000FE0F"  # Variation Selectors
+    "]+", flags=re.UNICODE)
+
+
+def _normalize_text(text):
+    """Replace dashes with spaces, normalize comma spacing to ', ' and
+    collapse runs of whitespace."""
+    text = _DASH_RE.sub(' ', text)
+    text = _COMMA_RE.sub(', ', text)
+    return _WS_RE.sub(' ', text).strip()
+
+
+# Long-lived scripts shipped to the browser on every CSV row. They are pinned
+# once per driver session (see D2LDateProcessor._pinned) so chromedriver
+# transfers and parses each of them a single time instead of per call.
+_JS_FIND_DATE_IFRAME = """
+    var frames = document.querySelectorAll('iframe');
+    function hasDateFields(f) {
+        try {
+            var d = f.contentDocument;
+            return !!(d && d.querySelector('input[name*="year"], input[name*="month"], input[name*="day"]'));
+        } catch (e) { return false; }
+    }
+    // Attribute heuristic first: the date editor frame usually advertises
+    // itself via src/title/id/name/class, so most dialogs resolve without
+    // reaching into the other frames' documents at all
+    var hint = /date|edit|mini/i;
+    for (var i = 0; i < frames.length; i++) {
+        var f = frames[i];
+        var attrs = (f.src || '') + ' ' + (f.title || '') + ' ' + (f.id || '') + ' ' +
+                    (f.name || '') + ' ' + (f.className || '');
+        if (hint.test(attrs) && hasDateFields(f)) { return i; }
+    }
+    for (var j = 0; j < frames.length; j++) {
+        if (hasDateFields(frames[j])) { return j; }
+    }
+    return -1;
+"""
+
+_JS_HAS_DATE_FIELDS = """
+    var dateFields = document.querySelectorAll('input[name*="year"], input[name*="month"], input[name*="day"]');
+    return dateFields.length > 0;
+"""
+
+# Mirrors the old XPath cascade: an exact 'Save' button first, then one whose
+# text contains 'Save', then the dialog's first visible button
+_JS_CLICK_SAVE = """
+    var btns = document.querySelectorAll("div.ddial_o button, [role='dialog'] button");
+    var partial = null;
+    for (var i = 0; i < btns.length; i++) {
+        var b = btns[i];
+        if (!b.offsetParent || b.disabled) { continue; }
+        var t = (b.textContent || '').trim();
+        if (t === 'Save') { b.click(); return true; }
+        if (partial === null && t.indexOf('Save') !== -1) { partial = b; }
+    }
+    if (partial) { partial.click(); return true; }
+    var first = document.querySelector('div.ddial_o button');
+    if (first && first.offsetParent && !first.disabled) { first.click(); return true; }
+    return false;
+"""
+
+# Same Save-button search, but run from inside the date iframe against the
+# parent document so the click happens without switching contexts first.
+# Returns false when the parent frame is cross-origin.
+_JS_CLICK_SAVE_PARENT = """
+    var doc;
+    try { doc = window.parent.document; } catch (e) { return false; }
+    if (!doc) { return false; }
+    var btns = doc.querySelectorAll("div.ddial_o button, [role='dialog'] button");
+    var partial = null;
+    for (var i = 0; i < btns.length; i++) {
+        var b = btns[i];
+        if (!b.offsetParent || b.disabled) { continue; }
+        var t = (b.textContent || '').trim();
+        if (t === 'Save') { b.click(); return true; }
+        if (partial === null && t.indexOf('Save') !== -1) { partial = b; }
+    }
+    if (partial) { partial.click(); return true; }
+    return false;
+"""
+
+_JS_SET_DATETIME = """
+    const checkboxId = arguments[0];
+    const month = arguments[1];
+    const day = arguments[2];
+    const year = arguments[3];
+    const hour = arguments[4];
+    const minute = arguments[5];
+    const strictCheckbox = arguments[6];
+
+    const checkboxResult = {found: false, wasUnchecked: false, nowChecked: false};
+    const checkbox = document.getElementById(checkboxId);
+    if (checkbox) {
+        checkboxResult.found = true;
+        if (checkbox.checked) {
+            checkboxResult.nowChecked = true;
+        } else {
+            // Checking the box enables the date fields; the change/input
+            // handlers run synchronously before the queries below
+            checkboxResult.wasUnchecked = true;
+            checkbox.checked = true;
+            checkbox.dispatchEvent(new Event('change', { bubbles: true }));
+            checkbox.dispatchEvent(new Event('input', { bubbles: true }));
+            checkboxResult.nowChecked = checkbox.checked;
+        }
+    }
+    if (!checkboxResult.found || (strictCheckbox && !checkboxResult.nowChecked)) {
+        return {dateFound: false, dateSet: false, timeFound: false, timeSet: false,
+                totalElements: 0, checkboxResult: checkboxResult};
+    }
+
+    const yearField = document.querySelector('input[name*="$year"]');
+    const monthField = document.querySelector('input[name*="$month"]');
+    const dayField = document.querySelector('input[name*="$day"]');
+    const hourField = document.querySelector('input[name*="$hour"]');
+    const minuteField = document.querySelector('input[name*="$minute"]');
+
+    let dateFound = false;
+    let dateSet = false;
+    let timeFound = false;
+    let timeSet = false;
+
+    if (yearField && monthField && dayField) {
+        dateFound = true;
+        try {
+            yearField.value = year;
+            monthField.value = month;
+            dayField.value = day;
+
+            [yearField, monthField, dayField].forEach(field => {
+                field.dispatchEvent(new Event('input', { bubbles: true }));
+                field.dispatchEvent(new Event('change', { bubbles: true }));
+            });
+
+            dateSet = true;
+        } catch (e) {
+            console.error('Error setting date:', e);
+        }
+    }
+
+    if (hourField && minuteField) {
+        timeFound = true;
+        try {
+            hourField.value = hour;
+            minuteField.value = minute;
+
+            [hourField, minuteField].forEach(field => {
+                field.dispatchEvent(new Event('input', { bubbles: true }));
+                field.dispatchEvent(new Event('change', { bubbles: true }));
+            });
+
+            timeSet = true;
+        } catch (e) {
+            console.error('Error setting time:', e);
+        }
+    }
+
+    return {
+        dateFound: dateFound,
+        dateSet: dateSet,
+        timeFound: timeFound,
+        timeSet: timeSet,
+        totalElements: (yearField ? 1 : 0) + (monthField ? 1 : 0) + (dayField ? 1 : 0) + (hourField ? 1 : 0) + (minuteField ? 1 : 0),
+        checkboxResult: checkboxResult
+    };
+"""
+
 
 class D2LDateProcessor:
     def __init__(self):
         self.driver = None
         self.logger = self.setup_logging()
-        
+        # Per-CSV-run cache: normalized assignment name -> name-link WebElement,
+        # built in a single JS round-trip instead of several find_elements
+        # wire calls per row. Reset at the start of each process_csv_file run.
+        self._row_index = None
+        # Remembers which start-date selector matched last time; on a given
+        # D2L page the same one matches for every row
+        self._start_date_selector = None
+        # ScriptKey cache for pin_script; keys are per driver session
+        self._pinned_scripts = {}
+        # WebDriverWait instances, cached per (timeout, poll) for the session
+        self._waits = {}
+        # Frame index that held the date fields last time; the mini-editor
+        # dialog keeps the same structure from row to row
+        self._date_iframe_index = None
+        # Which frame the driver is currently switched into (None = top);
+        # lets _enter_frame/_leave_frame skip redundant context switches
+        self._current_frame_id = None
+
+    def _wait(self, timeout, poll_frequency=0.5):
+        """Return a cached WebDriverWait for this timeout/poll combination."""
+        key = (timeout, poll_frequency)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+            self._waits[key] = wait
+        return wait
+
+    def _pinned(self, script):
+        """Return a pinned ScriptKey for a long-lived script, pinning on first
+        use; falls back to the raw source if pinning is unavailable."""
+        key = self._pinned_scripts.get(script)
+        if key is None:
+            try:
+                key = self.driver.pin_script(script)
+            except Exception:
+                key = script
+            self._pinned_scripts[script] = key
+        return key
+
     def setup_logging(self):
         """Setup logging configuration"""
-        # Create logs directory if it doesn't exist
-        os.makedirs('logs', exist_ok=True)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('logs/d2l_date_processing.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # Only configure once per process: each D2LDateProcessor() would
+        # otherwise stack another FileHandler + StreamHandler on the root
+        # logger and double-write every line for the rest of the session.
+        if not logging.getLogger().handlers:
+            # Create logs directory if it doesn't exist
+            os.makedirs('logs', exist_ok=True)
+
+            # Buffer file writes through a MemoryHandler so the hot CSV loop
+            # isn't paying a disk write per log line; records are flushed in
+            # batches of 1000 or immediately on any ERROR. The formatter must
+            # go on the inner FileHandler: basicConfig only formats the
+            # handlers it is handed, and flushed records are emitted by the
+            # target, not the MemoryHandler.
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            target_handler = logging.FileHandler('logs/d2l_date_processing.log')
+            target_handler.setFormatter(formatter)
+            file_handler = logging.handlers.MemoryHandler(
+                capacity=1000,
+                flushLevel=logging.ERROR,
+                target=target_handler
+            )
+
+            # Configure logging
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[
+                    file_handler,
+                    logging.StreamHandler()
+                ]
+            )
         return logging.getLogger(__name__)
         
     def setup_driver(self, use_profile=True):
         """Setup Chrome driver with persistent login session"""
         try:
-            from selenium.webdriver.chrome.options import Options
-            
+            # Lazy import: webdriver_manager can hit the network on import-time
+            # version checks, and only this method needs it. Keeping it out of
+            # module scope lets the GUI window appear sooner.
+            from webdriver_manager.chrome import ChromeDriverManager
+
             chrome_options = Options()
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument("--disable-web-security")
             chrome_options.add_argument("--allow-running-insecure-content")
+
+            # Trim default Chrome features that fire background network
+            # requests and JS on every new tab (translate bar, optimization
+            # hints, media router, component updates, sync, first-run checks)
+            chrome_options.add_argument("--disable-features=Translate,OptimizationHints,MediaRouter,DialMediaRouteProvider")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--disable-component-update")
+            chrome_options.add_argument("--no-first-run")
+            chrome_options.add_argument("--no-default-browser-check")
+
+            # The processor only reads text and clicks links; skip decoding
+            # images entirely
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            # Belt-and-braces with the blink flag: block images at the
+            # content-settings level too. CSS stays enabled - D2L's grid and
+            # dialogs need their layout
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 1,
+            })
             
             if use_profile:
                 # Use persistent profile for login session
-                import tempfile
                 profile_dir = os.path.join(tempfile.gettempdir(), "d2l_chrome_profile")
                 self.logger.info(f"Using persistent profile: {profile_dir}")
                 chrome_options.add_argument(f"--user-data-dir={profile_dir}")
@@ -349,9 +633,14 @@ class D2LDateProcessor:
             chrome_options.add_argument("--window-position=-1920,0")  # Left monitor position
             chrome_options.add_argument("--window-size=1920,1080")    # 2K resolution
             
-            # Try ChromeDriverManager first, then fallback
+            # Try ChromeDriverManager first, then fallback. The resolved
+            # binary path is memoized so relogins after clear_login skip the
+            # manager's version check and driver-cache scan
+            global _DRIVER_PATH
             try:
-                service = Service(ChromeDriverManager().install())
+                if _DRIVER_PATH is None:
+                    _DRIVER_PATH = ChromeDriverManager().install()
+                service = Service(_DRIVER_PATH)
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 self.logger.info("Chrome driver created successfully (ChromeDriverManager)")
             except Exception as e:
@@ -360,9 +649,52 @@ class D2LDateProcessor:
                 self.driver = webdriver.Chrome(options=chrome_options)
                 self.logger.info("Chrome driver created successfully (direct)")
             
+            # Record the chromedriver PID for the targeted kill at next startup
+            try:
+                with open(_PIDFILE, 'w') as pid_file:
+                    pid_file.write(str(self.driver.service.process.pid))
+            except (OSError, AttributeError) as e:
+                self.logger.warning(f"Could not record chromedriver PID: {e}")
+
+            # Keep the implicit wait at zero: the finder cascades probe with
+            # find_elements and rely on empty results returning immediately;
+            # any implicit timeout would multiply across every probe
+            self.driver.implicitly_wait(0)
+
             # Execute script to hide automation indicators
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
+
+            # Widen the keep-alive pool under the chromedriver HTTP channel;
+            # a CSV run issues thousands of WebDriver commands and the stock
+            # pool can fall back to new TCP connections under churn
+            try:
+                import urllib3
+                executor = self.driver.command_executor
+                if hasattr(executor, '_conn'):
+                    executor._conn.clear()
+                    executor._conn = urllib3.PoolManager(maxsize=20, block=False)
+            except Exception as e:
+                self.logger.warning(f"Could not resize WebDriver connection pool: {e}")
+
+            # Pinned script keys and cached waits belong to the previous
+            # session, if any
+            self._pinned_scripts = {}
+            self._waits = {}
+
+            # Block image/font/media downloads and third-party analytics via
+            # CDP - cuts page-load bytes and keeps tracker beacons from
+            # delaying the load event after each date save
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                    "urls": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+                             "*.woff", "*.woff2", "*.ttf", "*.mp4",
+                             "*google-analytics.com*", "*doubleclick.net*",
+                             "*segment.io*", "*newrelic*"]
+                })
+            except Exception as e:
+                self.logger.warning(f"Could not enable CDP URL blocking: {e}")
+
             self.logger.info("Chrome driver setup completed successfully")
             return True
             
@@ -374,119 +706,195 @@ class D2LDateProcessor:
         """Process CSV file and update assignments"""
         try:
             self.logger.info(f"Processing CSV file: {csv_file_path}")
-            
-            with open(csv_file_path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
+            # Rebuild the assignment-link index lazily for this run; the page
+            # may have changed since the last CSV was processed
+            self._row_index = None
+            self._date_iframe_index = None
+
+            # Large read buffer + plain csv.reader: no per-row dict allocation
+            # and no string-keyed header lookup per field access
+            with open(csv_file_path, 'r', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
+                reader = csv.reader(csvfile)
+                headers = next(reader, [])
+
                 # Validate CSV headers - UPDATED FOR USER'S EXACT FORMAT
                 required_headers = ['Name', 'Start Date', 'Start Time', 'Due Date', 'Due Time']
-                if not all(header in reader.fieldnames for header in required_headers):
+                if not all(header in headers for header in required_headers):
                     raise ValueError(f"CSV must have required headers: {required_headers}")
-                
-                self.logger.info(f"CSV headers found: {reader.fieldnames}")
-                
-                processed_count = 0
-                error_count = 0
-                
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 because row 1 is headers
-                    try:
-                        assignment_name = row['Name'].strip()
-                        if not assignment_name:
-                            self.logger.warning(f"Row {row_num}: Empty assignment name, skipping")
-                            continue
-                        
-                        # DEBUG: Show exactly what we're searching for
-                        self.logger.info(f"Row {row_num}: Processing assignment name: '{assignment_name}'")
-                        self.logger.info(f"Assignment name length: {len(assignment_name)} characters")
-                        self.logger.info(f"Assignment name repr: {repr(assignment_name)}")
-                        
-                        # Clean the assignment name of quotes
-                        clean_assignment_name = assignment_name.strip('"').strip("'").strip()
-                        if clean_assignment_name != assignment_name:
-                            self.logger.info(f"Cleaned assignment name: '{clean_assignment_name}'")
-                        
-                        # Process due date FIRST (to avoid D2L validation errors)
-                        start_success = False
-                        due_success = False
-                        
-                        due_date = row['Due Date'].strip()
-                        due_time = row['Due Time'].strip()
-                        
-                        # ENHANCED DEBUG: Show ALL CSV values
-                        self.logger.info(f"DEBUG: ALL CSV ROW VALUES:")
-                        for key, value in row.items():
-                            self.logger.info(f"  '{key}': '{value}' (len={len(value)})")
-                        
-                        self.logger.info(f"DEBUG: Raw due_date='{due_date}', due_time='{due_time}'")
-                        self.logger.info(f"DEBUG: due_date bool={bool(due_date)}, due_time bool={bool(due_time)}")
+
+                self.logger.info(f"CSV headers found: {headers}")
+
+                # Column positions resolved once, accessed by index in the loop
+                idx = {header: i for i, header in enumerate(headers)}
+                name_col = idx['Name']
+                start_date_col = idx['Start Date']
+                start_time_col = idx['Start Time']
+                due_date_col = idx['Due Date']
+                due_time_col = idx['Due Time']
+
+                rows = list(reader)
+
+            processed_count = 0
+            error_count = 0
+
+            # Validate every date/time pair up front with the module-level
+            # parsers, so a malformed value fails here instead of after a
+            # navigation and dialog open for that row
+            bad_rows = set()
+            for row_num, row in enumerate(rows, start=2):
+                if len(row) < len(headers):
+                    row = row + [''] * (len(headers) - len(row))
+                for date_col, time_col in ((due_date_col, due_time_col),
+                                           (start_date_col, start_time_col)):
+                    date_val = row[date_col].strip()
+                    time_val = row[time_col].strip()
+                    if date_val and time_val:
+                        try:
+                            self._parse_date_time(date_val, time_val)
+                        except (ValueError, TypeError) as e:
+                            self.logger.error(f"Row {row_num}: invalid date/time ('{date_val}' '{time_val}'): {e}")
+                            bad_rows.add(row_num)
+                            break
+            if bad_rows:
+                self.logger.error(f"Skipping {len(bad_rows)} row(s) with invalid dates")
+                error_count += len(bad_rows)
+
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 because row 1 is headers
+                if row_num in bad_rows:
+                    continue
+                try:
+                    # Pad short rows so index access matches DictReader's
+                    # forgiving behavior
+                    if len(row) < len(headers):
+                        row = row + [''] * (len(headers) - len(row))
+                    assignment_name = row[name_col].strip()
+                    if not assignment_name:
+                        self.logger.warning(f"Row {row_num}: Empty assignment name, skipping")
+                        continue
                         
-                        if due_date and due_time:
-                            self.logger.info(f"CONDITION MET: Setting due date: {due_date} at {due_time}")
-                            try:
-                                if self.set_assignment_due_date(clean_assignment_name, due_date, due_time):
-                                    self.logger.info("Due date set successfully!")
-                                    due_success = True
-                                else:
-                                    self.logger.error("Failed to set due date")
-                                    error_count += 1
-                            except Exception as e:
-                                self.logger.error(f"EXCEPTION during due date processing: {e}")
-                                error_count += 1
-                        else:
-                            self.logger.warning(f"SKIPPING due date - due_date='{due_date}' ({bool(due_date)}), due_time='{due_time}' ({bool(due_time)})")
+                    self.logger.info(f"Row {row_num}: Processing assignment name: '{assignment_name}'")
+                    # DEBUG: Show exactly what we're searching for
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Assignment name length: {len(assignment_name)} characters")
+                        self.logger.debug(f"Assignment name repr: {repr(assignment_name)}")
+
+                    # Clean the assignment name of quotes
+                    clean_assignment_name = assignment_name.strip('"').strip("'").strip()
+                    if clean_assignment_name != assignment_name:
+                        self.logger.info(f"Cleaned assignment name: '{clean_assignment_name}'")
                         
-                        # Ensure we're back on the main page before processing start date
-                        if due_success:
-                            self.logger.info("Returning to main page before processing start date...")
-                            time.sleep(0.5)  # Wait for any page transitions
+                    # Process due date FIRST (to avoid D2L validation errors)
+                    start_success = False
+                    due_success = False
                         
-                        # Process start date SECOND (after due date to avoid validation errors)
-                        start_date = row['Start Date'].strip()
-                        start_time = row['Start Time'].strip()
+                    due_date = row[due_date_col].strip()
+                    due_time = row[due_time_col].strip()
+                    start_date = row[start_date_col].strip()
+                    start_time = row[start_time_col].strip()
+
+                    # Nothing to set for this row - skip before any Selenium
+                    # round-trips happen
+                    if not (due_date and due_time) and not (start_date and start_time):
+                        self.logger.info(f"Row {row_num}: no dates to set, skipping")
+                        continue
                         
-                        if start_date and start_time:
-                            self.logger.info(f"Setting start date: {start_date} at {start_time}")
-                            if self.set_assignment_start_date(clean_assignment_name, start_date, start_time):
-                                self.logger.info("Start date set successfully!")
-                                start_success = True
+                    # ENHANCED DEBUG: Show ALL CSV values (debug-only; this
+                    # is ~10 formatted lines per row and adds up fast)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"DEBUG: ALL CSV ROW VALUES:")
+                        for key, value in zip(headers, row):
+                            self.logger.debug(f"  '{key}': '{value}' (len={len(value)})")
+                        self.logger.debug(f"DEBUG: Raw due_date='{due_date}', due_time='{due_time}'")
+                        self.logger.debug(f"DEBUG: due_date bool={bool(due_date)}, due_time bool={bool(due_time)}")
+
+                    # Resolve both date links with one name match instead
+                    # of re-running the cascade for due and start separately
+                    due_date_link, start_date_link = self.find_assignment_row(clean_assignment_name)
+
+                    if due_date and due_time:
+                        self.logger.info(f"CONDITION MET: Setting due date: {due_date} at {due_time}")
+                        try:
+                            if self.set_assignment_due_date(clean_assignment_name, due_date, due_time,
+                                                           due_date_link=due_date_link):
+                                self.logger.info("Due date set successfully!")
+                                due_success = True
                             else:
-                                self.logger.error("Failed to set start date")
+                                self.logger.error("Failed to set due date")
                                 error_count += 1
+                        except Exception as e:
+                            self.logger.error(f"EXCEPTION during due date processing: {e}")
+                            error_count += 1
+                    else:
+                        self.logger.warning(f"SKIPPING due date - due_date='{due_date}' ({bool(due_date)}), due_time='{due_time}' ({bool(due_time)})")
                         
-                        # Count as successful if at least one date was set
-                        if start_success or due_success:
-                            processed_count += 1
-                            self.logger.info(f"Successfully processed '{clean_assignment_name}'")
+                    # Ensure we're back on the main page before processing start date
+                    if due_success:
+                        self.logger.info("Waiting for the due date dialog to close...")
+                        try:
+                            self._wait(5).until(
+                                EC.invisibility_of_element_located((By.CSS_SELECTOR, "[role='dialog']"))
+                            )
+                        except TimeoutException:
+                            self.logger.warning("Due date dialog still visible; continuing anyway")
                         
-                        # Small delay between assignments
-                        time.sleep(0.5)
+                    # Process start date SECOND (after due date to avoid validation errors)
+                    if start_date and start_time:
+                        self.logger.info(f"Setting start date: {start_date} at {start_time}")
+                        if self.set_assignment_start_date(clean_assignment_name, start_date, start_time,
+                                                          start_date_link=start_date_link):
+                            self.logger.info("Start date set successfully!")
+                            start_success = True
+                        else:
+                            self.logger.error("Failed to set start date")
+                            error_count += 1
                         
-                    except Exception as e:
-                        self.logger.error(f"Error processing row {row_num}: {e}")
-                        error_count += 1
-                        continue
-                
-                self.logger.info(f"CSV processing completed: {processed_count} successful, {error_count} errors")
-                return processed_count, error_count
-                
+                    # Count as successful if at least one date was set
+                    if start_success or due_success:
+                        processed_count += 1
+                        self.logger.info(f"Successfully processed '{clean_assignment_name}'")
+
+                except Exception as e:
+                    self.logger.error(f"Error processing row {row_num}: {e}")
+                    error_count += 1
+                    continue
+
+            self.logger.info(f"CSV processing completed: {processed_count} successful, {error_count} errors")
+            return processed_count, error_count
+
+
         except Exception as e:
             self.logger.error(f"Error processing CSV file: {e}")
             return 0, 1
     
-    def set_assignment_due_date(self, assignment_name, due_date, due_time):
+    def set_assignment_due_date(self, assignment_name, due_date, due_time, due_date_link=None):
         """Set due date for a specific assignment"""
         try:
-            # Find and click the due date link
-            due_date_link = self.find_assignment_due_date_link(assignment_name)
+            # Find and click the due date link (unless the caller already
+            # resolved it via find_assignment_row)
+            if due_date_link is None:
+                due_date_link = self.find_assignment_due_date_link(assignment_name)
             if not due_date_link:
                 return False
-            
+
             # Click the due date link
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", due_date_link)
-            time.sleep(0.5)
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", due_date_link)
+            except Exception:
+                # A pre-resolved link can go stale if D2L re-rendered the
+                # table since the index was built; rebuild and re-find
+                self.logger.info("Due date link went stale, rebuilding row index")
+                self._row_index = None
+                due_date_link = self.find_assignment_due_date_link(assignment_name)
+                if not due_date_link:
+                    return False
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", due_date_link)
             due_date_link.click()
             self.logger.info("Clicked due date link")
-            time.sleep(2)
+            # Wait for the mini-editor dialog instead of a fixed delay - the
+            # dialog usually appears in well under a second
+            self._wait(10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[role='dialog']"))
+            )
             
             # Set the date in the mini editor
             result = self.set_date_in_mini_editor(due_date, due_time)
@@ -496,36 +904,46 @@ class D2LDateProcessor:
             self.logger.error(f"Error setting due date for '{assignment_name}': {e}")
             return False
     
-    def set_assignment_start_date(self, assignment_name, start_date, start_time):
+    def set_assignment_start_date(self, assignment_name, start_date, start_time, start_date_link=None):
         """Set start date for a specific assignment"""
         try:
-            # Find and click the start date link
-            start_date_link = self.find_assignment_start_date_link(assignment_name)
+            # Find and click the start date link (unless the caller already
+            # resolved it via find_assignment_row)
+            if start_date_link is None:
+                start_date_link = self.find_assignment_start_date_link(assignment_name)
             if not start_date_link:
                 return False
-            
+
             # Click the start date link with multiple methods
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", start_date_link)
-            time.sleep(0.5)
-            
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", start_date_link)
+            except Exception:
+                # The due-date save that runs just before this can re-render
+                # the row and stale the pre-resolved link; rebuild and re-find
+                self.logger.info("Start date link went stale, rebuilding row index")
+                self._row_index = None
+                start_date_link = self.find_assignment_start_date_link(assignment_name)
+                if not start_date_link:
+                    return False
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", start_date_link)
+
             self.logger.info("Attempting to click start date link...")
             try:
-                # Method 1: Regular click
-                start_date_link.click()
-                self.logger.info("SUCCESS: Selenium click on start date link executed")
+                # Single JS click: fires whether or not the link is scrolled
+                # into view, so the regular-click/JS-click double attempt and
+                # its intermediate waits are unnecessary
+                self.driver.execute_script("arguments[0].click();", start_date_link)
+                self.logger.info("SUCCESS: JavaScript click on start date link executed")
             except Exception as e:
-                self.logger.warning(f"Selenium click failed: {e}")
-                try:
-                    # Method 2: JavaScript click
-                    self.driver.execute_script("arguments[0].click();", start_date_link)
-                    self.logger.info("SUCCESS: JavaScript click on start date link executed")
-                except Exception as e2:
-                    self.logger.error(f"JavaScript click also failed: {e2}")
-                    return False
-            
-            # Wait longer for the start date editor to appear
+                self.logger.error(f"JavaScript click failed: {e}")
+                return False
+
+            # Wait for the start date editor to actually appear rather than
+            # sleeping a worst-case amount
             self.logger.info("Waiting for start date mini-editor to load...")
-            time.sleep(3)  # Increased wait time
+            self._wait(10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[role='dialog']"))
+            )
             
             # Set the date in the mini editor (with start date checkbox)
             result = self.set_start_date_in_mini_editor(start_date, start_time)
@@ -549,133 +967,251 @@ class D2LDateProcessor:
         str
             The text with emojis removed.
         """
-        import re
-        # Remove emojis and emoji-related Unicode ranges
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # Emoticons
-            "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
-            "\U0001F680-\U0001F6FF"  # Transport and Map
-            "\U0001F1E0-\U0001F1FF"  # Flags
-            "\U00002702-\U000027B0"  # Dingbats
-            "\U000024C2-\U0001F251"  # Enclosed characters
-            "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-            "\U0001FA00-\U0001FA6F"  # Chess Symbols
-            "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-            "\U00002600-\U000026FF"  # Miscellaneous Symbols
-            "\U00002700-\U000027BF"  # Dingbats
-            "\U0000FE00-\U0000FE0F"  # Variation Selectors
-            "]+", flags=re.UNICODE)
-        return emoji_pattern.sub('', text).strip()
+        return _EMOJI_RE.sub('', text).strip()
+
+    def _normalize_name(self, text):
+        """Normalize an assignment name for index lookups: dashes to spaces,
+        comma spacing to ', ', collapsed whitespace, emojis removed, lowercased."""
+        return self._remove_emojis(_normalize_text(text)).lower()
+
+    def _build_row_index(self):
+        """Scrape all assignment-name links in one round-trip and index them.
+
+        The finder functions otherwise issue 3-6 separate find_elements wire
+        calls per CSV row against the same static table. A single
+        execute_script call walks every row in-browser and returns the name
+        text plus the name, due-date and start-date anchors for each; the
+        result is a dict from normalized name to those elements that the
+        finders consult before falling back to their XPath cascades.
+        """
+        try:
+            scraped = self.driver.execute_script("""
+                const rows = [];
+                document.querySelectorAll("td[class*='d_dg_col_Name'] a").forEach(a => {
+                    const tr = a.closest('tr');
+                    let due = null, start = null;
+                    if (tr) {
+                        due = tr.querySelector("td[class*='DueDate'] a, a[title='Edit the due date']");
+                        start = tr.querySelector("td[class*='StartDate'] a, a[title='Edit the start date']");
+                    }
+                    rows.push({text: a.textContent.trim(), link: a, due: due, start: start});
+                });
+                // Also stash a Map on the page for O(1) in-browser lookups,
+                // keyed by dash/whitespace-normalized lowercase name
+                window.__d2l_index = new Map(rows.map(r =>
+                    [r.text.toLowerCase().replace(/[-–—−\s]+/g, ' ').trim(), r.link]));
+                return rows;
+            """)
+        except Exception as e:
+            self.logger.warning(f"Could not build row index: {e}")
+            self._row_index = {}
+            return self._row_index
+
+        index = {}
+        for entry in scraped:
+            # First occurrence wins, matching the [0] pick in the finders
+            index.setdefault(self._normalize_name(entry['text']), entry)
+        self._row_index = index
+        self.logger.info(f"Indexed {len(index)} assignment rows in one round-trip")
+        return index
+
+    def _js_index_lookup(self, assignment_name):
+        """O(1) lookup of an assignment name link via the window.__d2l_index
+        Map stashed by _build_row_index; returns the anchor element or None."""
+        key = _WS_RE.sub(' ', _DASH_RE.sub(' ', assignment_name.lower())).strip()
+        try:
+            return self.driver.execute_script(
+                "const m = window.__d2l_index;"
+                "if (!m) { return null; }"
+                "const a = m.get(arguments[0]) || null;"
+                "if (a) { a.scrollIntoView(); }"
+                "return a;", key)
+        except Exception:
+            return None
+
+    def _fuzzy_index_lookup(self, assignment_name):
+        """Best fuzzy match for a name against the cached row index.
+
+        Scores every indexed name in one rapidfuzz C++ call instead of a
+        Python-level loop; returns the matching index entry, or None when
+        nothing clears the cutoff or rapidfuzz is not installed.
+        """
+        if not self._row_index:
+            return None
+        try:
+            from rapidfuzz import fuzz, process
+        except ImportError:
+            return None
+        match = process.extractOne(
+            self._normalize_name(assignment_name), list(self._row_index.keys()),
+            scorer=fuzz.WRatio, score_cutoff=80)
+        if match is None:
+            return None
+        key, score = match[0], match[1]
+        self.logger.info(f"Fuzzy match: '{assignment_name}' -> '{key}' (score {score:.0f})")
+        return self._row_index[key]
+
+    def _evaluate_xpath(self, template, text):
+        """Run an XPath with a $name placeholder bound via JSON.stringify.
+
+        Keeps the XPath template constant across lookups and makes names
+        containing apostrophes safe — f-string interpolation would break the
+        query for a name like "Bob's quiz". Returns a list of elements.
+        """
+        try:
+            return self.driver.execute_script(
+                "const xpath = arguments[0].replace('$name', JSON.stringify(arguments[1]));"
+                "const r = document.evaluate(xpath, document, null,"
+                " XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);"
+                "const out = [];"
+                "for (let i = 0; i < r.snapshotLength; i++) { out.push(r.snapshotItem(i)); }"
+                "return out;", template, text)
+        except Exception:
+            return []
+
+    def _batch_link_texts(self, elements):
+        """Fetch text for a list of elements in one wire call instead of one
+        link.text round-trip each; returns a parallel list of stripped strings."""
+        if not elements:
+            return []
+        try:
+            return self.driver.execute_script(
+                "return arguments[0].map(e => (e.textContent || '').trim());", elements)
+        except Exception:
+            return [link.text.strip() for link in elements]
+
+    def _batch_link_hrefs(self, elements):
+        """Fetch href for a list of elements in one wire call; parallel list."""
+        if not elements:
+            return []
+        try:
+            return self.driver.execute_script(
+                "return arguments[0].map(e => e.href || '');", elements)
+        except Exception:
+            return [(link.get_attribute('href') or '') for link in elements]
+
+    def find_assignment_row(self, assignment_name):
+        """Resolve both date links for an assignment with a single name match.
+
+        Returns a ``(due_link, start_link)`` tuple (either may be None). On a
+        row-index hit this costs no wire calls at all; only when the index has
+        no entry for the name does it fall back to the two per-link cascades.
+        """
+        if self._row_index is None:
+            self._build_row_index()
+        indexed = self._row_index.get(self._normalize_name(assignment_name))
+        if indexed is None:
+            # Exact-key miss: fuzzy-score the indexed names before resorting
+            # to the wire-call cascades (catches CSV/page naming drift)
+            indexed = self._fuzzy_index_lookup(assignment_name)
+        if indexed is not None:
+            return indexed.get('due'), indexed.get('start')
+        # Index miss (unusual markup the scrape selector didn't catch): fall
+        # back to the full finder cascades
+        return (self.find_assignment_due_date_link(assignment_name),
+                self.find_assignment_start_date_link(assignment_name))
 
     def find_assignment_due_date_link(self, assignment_name):
         """Find the due date link for a specific assignment by name with fuzzy matching"""
         try:
             self.logger.info(f"Looking for due date link for assignment: '{assignment_name}'")
             
-            # Strategy 1: Exact match - try multiple variations
-            self.logger.info(f"Searching for EXACT match: '{assignment_name}'")
-            
-            # Try exact match first
-            assignment_links = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{assignment_name}')]")
-            
+            # Strategy 0: consult the per-run row index (one wire call per CSV
+            # run instead of several per row)
+            if self._row_index is None:
+                self._build_row_index()
+            assignment_links = []
+            indexed = self._row_index.get(self._normalize_name(assignment_name))
+            if indexed is not None:
+                if indexed.get('due') is not None:
+                    self.logger.info("Found due date link via cached row index")
+                    return indexed['due']
+                self.logger.info("Found assignment link via cached row index")
+                assignment_links = [indexed['link']]
+
+            # Strategy 1: Exact match via the in-page Map - O(1) hash lookup
+            # instead of a full-DOM contains(text()) XPath scan
+            if not assignment_links:
+                self.logger.info(f"Searching for EXACT match: '{assignment_name}'")
+
+                link = self._js_index_lookup(assignment_name)
+                if link is not None:
+                    assignment_links = [link]
+
             # If no exact match, try normalized matching (remove dashes, normalize commas, remove emojis)
             if not assignment_links:
-                # Normalize search term: remove dashes, normalize comma spacing, collapse spaces
-                import re
-                name_normalized = re.sub(r'[-–—−]', ' ', assignment_name)  # Replace dashes with spaces
-                name_normalized = re.sub(r',\s*', ', ', name_normalized)  # Normalize comma spacing to ", "
-                name_normalized = re.sub(r'\s+', ' ', name_normalized).strip()  # Collapse multiple spaces
-                name_normalized = self._remove_emojis(name_normalized)  # Remove emojis
-                name_normalized_lower = name_normalized.lower()
-                self.logger.info(f"Trying normalized search: '{name_normalized}'")
-                
-                # Find all links and check their text with the same normalization
-                all_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                for link in all_links:
-                    try:
-                        link_text = link.text.strip()
-                        link_normalized = re.sub(r'[-–—−]', ' ', link_text)  # Replace dashes with spaces
-                        link_normalized = re.sub(r',\s*', ', ', link_normalized)  # Normalize comma spacing to ", "
-                        link_normalized = re.sub(r'\s+', ' ', link_normalized).strip()  # Collapse multiple spaces
-                        link_normalized = self._remove_emojis(link_normalized)  # Remove emojis
-                        link_normalized_lower = link_normalized.lower()
-                        
-                        # EXACT MATCH ONLY after normalization - prevents confusion between similar assignments
-                        if name_normalized_lower == link_normalized_lower:
-                            self.logger.info(f"SUCCESS: Found exact normalized match! '{link_text}'")
-                            assignment_links = [link]
-                            break
-                    except:
-                        continue
+                name_key = self._normalize_name(assignment_name)
+                self.logger.info(f"Trying normalized search: '{name_key}'")
+
+                # The row index already memoizes every link under exactly this
+                # normalization; rebuild it (the page may have changed since
+                # it was built) and look up instead of re-normalizing every
+                # candidate link's text on each call
+                indexed = self._build_row_index().get(name_key)
+                if indexed is not None:
+                    # EXACT MATCH ONLY after normalization - prevents confusion between similar assignments
+                    self.logger.info(f"SUCCESS: Found exact normalized match! '{indexed['text']}'")
+                    assignment_links = [indexed['link']]
             
             # If still no match, try without quotes and emojis
             if not assignment_links:
                 clean_name = assignment_name.replace('"', '').replace("'", '')
                 self.logger.info(f"Trying without quotes: '{clean_name}'")
-                assignment_links = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{clean_name}')]")
+                assignment_links = self._evaluate_xpath("//a[contains(text(), $name)]", clean_name)
                 
                 # Also try matching with emojis removed from both sides
                 if not assignment_links:
                     clean_name_no_emoji = self._remove_emojis(clean_name)
-                    all_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                    for link in all_links:
-                        try:
-                            link_text = link.text.strip()
-                            link_text_no_emoji = self._remove_emojis(link_text)
-                            # Normalize: dashes to spaces, comma spacing, collapse spaces
-                            clean_normalized = re.sub(r'[-–—−]', ' ', clean_name_no_emoji)
-                            clean_normalized = re.sub(r',\s*', ', ', clean_normalized)
-                            clean_normalized = re.sub(r'\s+', ' ', clean_normalized).strip().lower()
-                            link_normalized = re.sub(r'[-–—−]', ' ', link_text_no_emoji)
-                            link_normalized = re.sub(r',\s*', ', ', link_normalized)
-                            link_normalized = re.sub(r'\s+', ' ', link_normalized).strip().lower()
-                            # EXACT MATCH ONLY after normalization
-                            if clean_normalized == link_normalized:
-                                self.logger.info(f"SUCCESS: Found exact normalized match! '{link_text}'")
-                                assignment_links = [link]
-                                break
-                        except:
-                            continue
+                    all_links = self.driver.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_Name'] a")
+                    # Normalize the target once, then short-circuit on the first
+                    # link whose normalized text matches exactly
+                    clean_normalized = _normalize_text(clean_name_no_emoji).lower()
+                    match = next(
+                        ((link, link_text)
+                         for link, link_text in zip(all_links, self._batch_link_texts(all_links))
+                         if _normalize_text(self._remove_emojis(link_text)).lower() == clean_normalized),
+                        None)
+                    if match is not None:
+                        self.logger.info(f"SUCCESS: Found exact normalized match! '{match[1]}'")
+                        assignment_links = [match[0]]
             
             # If still no match, try the key part only
             if not assignment_links and 'key' in assignment_name:
                 key_part = assignment_name.replace(' key', '')
                 self.logger.info(f"Trying without 'key': '{key_part}'")
-                assignment_links = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{key_part}')]")
+                assignment_links = self._evaluate_xpath("//a[contains(text(), $name)]", key_part)
                 
                 # Also try with emojis removed
                 if not assignment_links:
                     key_part_no_emoji = self._remove_emojis(key_part)
-                    all_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                    for link in all_links:
-                        try:
-                            link_text = link.text.strip()
-                            link_text_no_emoji = self._remove_emojis(link_text)
-                            if key_part_no_emoji.lower() in link_text_no_emoji.lower() or link_text_no_emoji.lower() in key_part_no_emoji.lower():
-                                self.logger.info(f"SUCCESS: Found match ignoring emojis! '{link_text}'")
-                                assignment_links = [link]
-                                break
-                        except:
-                            continue
+                    all_links = self.driver.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_Name'] a")
+                    key_norm = key_part_no_emoji.lower()
+                    match = next(
+                        ((link, link_text)
+                         for link, link_text in zip(all_links, self._batch_link_texts(all_links))
+                         for candidate in (self._remove_emojis(link_text).lower(),)
+                         if key_norm in candidate or candidate in key_norm),
+                        None)
+                    if match is not None:
+                        self.logger.info(f"SUCCESS: Found match ignoring emojis! '{match[1]}'")
+                        assignment_links = [match[0]]
             
             if assignment_links:
                 self.logger.info(f"EXACT MATCH: Found {len(assignment_links)} assignment name links")
-                for i, link in enumerate(assignment_links):
-                    self.logger.info(f"  Exact match {i+1}: '{link.text.strip()}'")
+                for i, text in enumerate(self._batch_link_texts(assignment_links)):
+                    self.logger.info(f"  Exact match {i+1}: '{text}'")
             else:
                 # Strategy 2: Show what we actually found for debugging
                 self.logger.error(f"NO EXACT MATCHES FOUND for '{assignment_name}'")
                 self.logger.error("Available assignment names on page:")
                 
                 # Show all assignment-like links for debugging
-                all_assignment_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                for i, link in enumerate(all_assignment_links[:10]):
+                all_assignment_links = self.driver.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_Name'] a")
+                for i, text in enumerate(self._batch_link_texts(all_assignment_links[:10])):
                     try:
-                        text = link.text.strip()
                         if text and len(text) > 5:
                             self.logger.error(f"  Available {i+1}: '{text}'")
-                    except:
+                    except StaleElementReferenceException:
                         continue
             
             if assignment_links:
@@ -683,33 +1219,31 @@ class D2LDateProcessor:
                 assignment_link = assignment_links[0]
                 
                 # Find the parent row (tr) of this assignment
-                parent_row = assignment_link.find_element(By.XPATH, "./ancestor::tr")
+                parent_row = self.driver.execute_script("return arguments[0].closest('tr');", assignment_link)
                 self.logger.info("Found parent row for the assignment")
                 
                 # Look for due date links within this row - UPDATED TO HANDLE DASHES
-                due_date_links = parent_row.find_elements(By.XPATH, ".//a[@title='Edit the due date']")
+                due_date_links = parent_row.find_elements(By.CSS_SELECTOR, "a[title='Edit the due date']")
                 if not due_date_links:
-                    # Try finding links in the due date column specifically
-                    due_date_cells = parent_row.find_elements(By.XPATH, ".//td[contains(@class, 'd_dg_col_DueDate')]")
-                    for cell in due_date_cells:
-                        cell_links = cell.find_elements(By.XPATH, ".//a")
-                        for link in cell_links:
-                            link_text = link.text.strip()
-                            # Accept both actual dates AND dashes (empty date fields)
-                            if (any(pattern in link_text for pattern in ['2025', '2026', '/', 'PM', 'AM']) or 
-                                link_text == '-' or link_text == ''):
-                                due_date_links.append(link)
-                                self.logger.info(f"Found due date link (including dash): '{link_text}'")
-                                break
-                    
+                    # Try finding links in the due date column specifically;
+                    # one descendant query replaces the per-cell loop, and
+                    # the texts come back in one wire call
+                    cell_links = parent_row.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_DueDate'] a")
+                    for link, link_text in zip(cell_links, self._batch_link_texts(cell_links)):
+                        # Accept both actual dates AND dashes (empty date fields)
+                        if (_DATE_RE.search(link_text) or
+                            link_text == '-' or link_text == ''):
+                            due_date_links.append(link)
+                            self.logger.info(f"Found due date link (including dash): '{link_text}'")
+                            break
+
                     # Fallback: try alternative selectors within the row
                     if not due_date_links:
-                        due_date_links = parent_row.find_elements(By.XPATH, ".//a[contains(@class, 'd2l-link-inline')]")
+                        due_date_links = parent_row.find_elements(By.CSS_SELECTOR, "a.d2l-link-inline")
                         # Filter for date-like text OR dashes
                         date_links = []
-                        for link in due_date_links:
-                            link_text = link.text.strip()
-                            if (any(pattern in link_text for pattern in ['2025', '2026', '/', 'PM', 'AM']) or 
+                        for link, link_text in zip(due_date_links, self._batch_link_texts(due_date_links)):
+                            if (_DATE_RE.search(link_text) or
                                 link_text == '-'):
                                 date_links.append(link)
                         due_date_links = date_links
@@ -721,7 +1255,7 @@ class D2LDateProcessor:
                     self.logger.info("No due date link found in the assignment row")
             
             # Strategy 2: If that doesn't work, try finding by table structure
-            assignment_cells = self.driver.find_elements(By.XPATH, f"//td[contains(., '{assignment_name}')]")
+            assignment_cells = self._evaluate_xpath("//td[contains(., $name)]", assignment_name)
             
             if assignment_cells:
                 self.logger.info(f"Found {len(assignment_cells)} cells containing assignment name")
@@ -729,25 +1263,23 @@ class D2LDateProcessor:
                 for assignment_cell in assignment_cells:
                     try:
                         # Find the parent row
-                        parent_row = assignment_cell.find_element(By.XPATH, "./ancestor::tr")
+                        parent_row = self.driver.execute_script("return arguments[0].closest('tr');", assignment_cell)
                         
                         # Look for due date links within this row
-                        due_date_links = parent_row.find_elements(By.XPATH, ".//a[@title='Edit the due date']")
+                        due_date_links = parent_row.find_elements(By.CSS_SELECTOR, "a[title='Edit the due date']")
                         if not due_date_links:
-                            due_date_links = parent_row.find_elements(By.XPATH, ".//a[contains(@class, 'd2l-link-inline')]")
+                            due_date_links = parent_row.find_elements(By.CSS_SELECTOR, "a.d2l-link-inline")
                             # Filter for date-like text
                             date_links = []
-                            for link in due_date_links:
-                                link_text = link.text.strip()
-                                if any(pattern in link_text for pattern in ['2025', '2026', '/', 'PM', 'AM']):
+                            for link, link_text in zip(due_date_links, self._batch_link_texts(due_date_links)):
+                                if _DATE_RE.search(link_text):
                                     date_links.append(link)
                             due_date_links = date_links
-                        
+
                         if due_date_links:
-                            due_date_text = due_date_links[0].text.strip()
-                            self.logger.info(f"Found due date link: '{due_date_text}'")
+                            self.logger.info("Found due date link in assignment cell row")
                             return due_date_links[0]
-                    except Exception as e:
+                    except (NoSuchElementException, StaleElementReferenceException) as e:
                         self.logger.info(f"Could not process assignment cell: {e}")
                         continue
             
@@ -763,72 +1295,65 @@ class D2LDateProcessor:
         try:
             self.logger.info(f"Looking for start date link for assignment: '{assignment_name}'")
             
-            # Strategy 1: Exact match - try multiple variations
-            self.logger.info(f"Searching for EXACT match: '{assignment_name}'")
-            
-            # Try exact match first
-            assignment_links = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{assignment_name}')]")
-            if assignment_links:
-                self.logger.info(f"SUCCESS: Found exact match!")
+            # Strategy 0: consult the per-run row index (one wire call per CSV
+            # run instead of several per row)
+            if self._row_index is None:
+                self._build_row_index()
+            assignment_links = []
+            indexed = self._row_index.get(self._normalize_name(assignment_name))
+            if indexed is not None:
+                if indexed.get('start') is not None:
+                    self.logger.info("Found start date link via cached row index")
+                    return indexed['start']
+                self.logger.info("Found assignment link via cached row index")
+                assignment_links = [indexed['link']]
+
+            # Strategy 1: Exact match via the in-page Map - O(1) hash lookup
+            # instead of a full-DOM contains(text()) XPath scan
+            if not assignment_links:
+                self.logger.info(f"Searching for EXACT match: '{assignment_name}'")
+
+                link = self._js_index_lookup(assignment_name)
+                if link is not None:
+                    assignment_links = [link]
+                    self.logger.info(f"SUCCESS: Found exact match!")
             
             # If no exact match, try normalized matching (remove dashes, normalize commas, remove emojis)
             if not assignment_links:
-                # Normalize search term: remove dashes, normalize comma spacing, collapse spaces
-                import re
-                name_normalized = re.sub(r'[-–—−]', ' ', assignment_name)  # Replace dashes with spaces
-                name_normalized = re.sub(r',\s*', ', ', name_normalized)  # Normalize comma spacing to ", "
-                name_normalized = re.sub(r'\s+', ' ', name_normalized).strip()  # Collapse multiple spaces
-                name_normalized = self._remove_emojis(name_normalized)  # Remove emojis
-                name_normalized_lower = name_normalized.lower()
-                self.logger.info(f"Trying normalized search: '{name_normalized}'")
-                
-                # Find all links and check their text with the same normalization
-                all_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                for link in all_links:
-                    try:
-                        link_text = link.text.strip()
-                        link_normalized = re.sub(r'[-–—−]', ' ', link_text)  # Replace dashes with spaces
-                        link_normalized = re.sub(r',\s*', ', ', link_normalized)  # Normalize comma spacing to ", "
-                        link_normalized = re.sub(r'\s+', ' ', link_normalized).strip()  # Collapse multiple spaces
-                        link_normalized = self._remove_emojis(link_normalized)  # Remove emojis
-                        link_normalized_lower = link_normalized.lower()
-                        
-                        # EXACT MATCH ONLY after normalization - prevents confusion between similar assignments
-                        if name_normalized_lower == link_normalized_lower:
-                            self.logger.info(f"SUCCESS: Found exact normalized match! '{link_text}'")
-                            assignment_links = [link]
-                            break
-                    except:
-                        continue
+                name_key = self._normalize_name(assignment_name)
+                self.logger.info(f"Trying normalized search: '{name_key}'")
+
+                # The row index already memoizes every link under exactly this
+                # normalization; rebuild it (the page may have changed since
+                # it was built) and look up instead of re-normalizing every
+                # candidate link's text on each call
+                indexed = self._build_row_index().get(name_key)
+                if indexed is not None:
+                    # EXACT MATCH ONLY after normalization - prevents confusion between similar assignments
+                    self.logger.info(f"SUCCESS: Found exact normalized match! '{indexed['text']}'")
+                    assignment_links = [indexed['link']]
             
             # If still no match, try without quotes and emojis
             if not assignment_links:
                 clean_name = assignment_name.replace('"', '').replace("'", '')
                 self.logger.info(f"Trying without quotes: '{clean_name}'")
-                assignment_links = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{clean_name}')]")
+                assignment_links = self._evaluate_xpath("//a[contains(text(), $name)]", clean_name)
                 
                 # Also try matching with emojis removed from both sides
                 if not assignment_links:
                     clean_name_no_emoji = self._remove_emojis(clean_name)
-                    all_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                    for link in all_links:
-                        try:
-                            link_text = link.text.strip()
-                            link_text_no_emoji = self._remove_emojis(link_text)
-                            # Normalize: dashes to spaces, comma spacing, collapse spaces
-                            clean_normalized = re.sub(r'[-–—−]', ' ', clean_name_no_emoji)
-                            clean_normalized = re.sub(r',\s*', ', ', clean_normalized)
-                            clean_normalized = re.sub(r'\s+', ' ', clean_normalized).strip().lower()
-                            link_normalized = re.sub(r'[-–—−]', ' ', link_text_no_emoji)
-                            link_normalized = re.sub(r',\s*', ', ', link_normalized)
-                            link_normalized = re.sub(r'\s+', ' ', link_normalized).strip().lower()
-                            # EXACT MATCH ONLY after normalization
-                            if clean_normalized == link_normalized:
-                                self.logger.info(f"SUCCESS: Found exact normalized match! '{link_text}'")
-                                assignment_links = [link]
-                                break
-                        except:
-                            continue
+                    all_links = self.driver.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_Name'] a")
+                    # Normalize the target once, then short-circuit on the first
+                    # link whose normalized text matches exactly
+                    clean_normalized = _normalize_text(clean_name_no_emoji).lower()
+                    match = next(
+                        ((link, link_text)
+                         for link, link_text in zip(all_links, self._batch_link_texts(all_links))
+                         if _normalize_text(self._remove_emojis(link_text)).lower() == clean_normalized),
+                        None)
+                    if match is not None:
+                        self.logger.info(f"SUCCESS: Found exact normalized match! '{match[1]}'")
+                        assignment_links = [match[0]]
                 if assignment_links:
                     self.logger.info(f"SUCCESS: Found match without quotes!")
             
@@ -836,22 +1361,22 @@ class D2LDateProcessor:
             if not assignment_links and 'key' in assignment_name:
                 key_part = assignment_name.replace(' key', '')
                 self.logger.info(f"Trying without 'key': '{key_part}'")
-                assignment_links = self.driver.find_elements(By.XPATH, f"//a[contains(text(), '{key_part}')]")
+                assignment_links = self._evaluate_xpath("//a[contains(text(), $name)]", key_part)
                 
                 # Also try with emojis removed
                 if not assignment_links:
                     key_part_no_emoji = self._remove_emojis(key_part)
-                    all_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
-                    for link in all_links:
-                        try:
-                            link_text = link.text.strip()
-                            link_text_no_emoji = self._remove_emojis(link_text)
-                            if key_part_no_emoji.lower() in link_text_no_emoji.lower() or link_text_no_emoji.lower() in key_part_no_emoji.lower():
-                                self.logger.info(f"SUCCESS: Found match ignoring emojis! '{link_text}'")
-                                assignment_links = [link]
-                                break
-                        except:
-                            continue
+                    all_links = self.driver.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_Name'] a")
+                    key_norm = key_part_no_emoji.lower()
+                    match = next(
+                        ((link, link_text)
+                         for link, link_text in zip(all_links, self._batch_link_texts(all_links))
+                         for candidate in (self._remove_emojis(link_text).lower(),)
+                         if key_norm in candidate or candidate in key_norm),
+                        None)
+                    if match is not None:
+                        self.logger.info(f"SUCCESS: Found match ignoring emojis! '{match[1]}'")
+                        assignment_links = [match[0]]
                 if assignment_links:
                     self.logger.info(f"SUCCESS: Found match without 'key'!")
             
@@ -861,15 +1386,14 @@ class D2LDateProcessor:
                 self.logger.error("Available content names on page:")
                 
                 # Show all content including content topics
-                all_content_links = self.driver.find_elements(By.XPATH, "//td[contains(@class, 'd_dg_col_Name')]//a")
+                all_content_links = self.driver.find_elements(By.CSS_SELECTOR, "td[class*='d_dg_col_Name'] a")
                 self.logger.error(f"Found {len(all_content_links)} total content items:")
                 # Show first 15
-                for i, link in enumerate(all_content_links[:15]):
+                for i, text in enumerate(self._batch_link_texts(all_content_links[:15])):
                     try:
-                        text = link.text.strip()
                         if text and len(text) > 2:
                             self.logger.error(f"  Available {i+1}: '{text}'")
-                    except:
+                    except StaleElementReferenceException:
                         continue
             
             if assignment_links:
@@ -877,51 +1401,57 @@ class D2LDateProcessor:
                 assignment_link = assignment_links[0]
                 
                 # Find the parent row (tr) of this assignment
-                parent_row = assignment_link.find_element(By.XPATH, "./ancestor::tr")
+                parent_row = self.driver.execute_script("return arguments[0].closest('tr');", assignment_link)
                 self.logger.info("Found parent row for the assignment")
                 
                 # Use EXACT selectors from user recording
                 start_date_selectors = [
-                    ".//td[contains(@class, 'd_dg_col_StartDate')]//a",  # Exact from recording
-                    ".//td[contains(@class, 'StartDate')]//a",  # Fallback
-                    ".//a[@title='Edit the start date']",  # Standard pattern
+                    "td[class*='d_dg_col_StartDate'] a",  # Exact from recording
+                    "td[class*='StartDate'] a",  # Fallback
+                    "a[title='Edit the start date']",  # Standard pattern
                 ]
-                
+
+                # Try last run's winning selector first instead of re-walking
+                # the whole cascade for every row
+                if self._start_date_selector in start_date_selectors:
+                    start_date_selectors = [self._start_date_selector] + [
+                        s for s in start_date_selectors if s != self._start_date_selector]
+
                 for selector in start_date_selectors:
                     try:
-                        start_date_links = parent_row.find_elements(By.XPATH, selector)
+                        start_date_links = parent_row.find_elements(By.CSS_SELECTOR, selector)
                         if start_date_links:
                             # Filter for date-like text (including "-" which means create new date)
-                            for link in start_date_links:
-                                link_text = link.text.strip()
+                            for link, link_text in zip(start_date_links, self._batch_link_texts(start_date_links)):
                                 if link_text == '-':
                                     self.logger.info(f"Found clickable '-' link to create new start date")
+                                    self._start_date_selector = selector
                                     return link
-                                if any(pattern in link_text for pattern in ['2025', '2026', '/', 'PM', 'AM', 'No start date']):
+                                if _DATE_RE.search(link_text) or 'No start date' in link_text:
                                     self.logger.info(f"Found start date link with selector '{selector}': '{link_text}'")
+                                    self._start_date_selector = selector
                                     return link
-                    except Exception as e:
+                    except (NoSuchElementException, StaleElementReferenceException):
                         continue
                 
                 # Fallback: Look for any links in the row that might be start dates
-                all_links = parent_row.find_elements(By.XPATH, ".//a[contains(@class, 'd2l-link-inline')]")
+                all_links = parent_row.find_elements(By.CSS_SELECTOR, "a.d2l-link-inline")
                 self.logger.info(f"Found {len(all_links)} total links in assignment row")
                 
-                for i, link in enumerate(all_links):
-                    link_text = link.text.strip()
-                    href = link.get_attribute('href') or ''
+                link_hrefs = self._batch_link_hrefs(all_links)
+                for link, link_text, href in zip(all_links, self._batch_link_texts(all_links), link_hrefs):
                     
                     # Look for start date patterns (different from due date)
                     if ('start' in href.lower() or 
                         'availability' in href.lower() or
                         link_text == 'No start date' or
-                        (any(pattern in link_text for pattern in ['2025', '2026', '/', 'PM', 'AM']) and 
+                        (_DATE_RE.search(link_text) and 
                          'due' not in href.lower())):  # Exclude due date links
                         self.logger.info(f"Potential start date link found: '{link_text}'")
                         return link
             
             # Strategy 2: Look for table cells that contain the assignment name
-            assignment_cells = self.driver.find_elements(By.XPATH, f"//td[contains(., '{assignment_name}')]")
+            assignment_cells = self._evaluate_xpath("//td[contains(., $name)]", assignment_name)
             
             if assignment_cells:
                 self.logger.info(f"Found {len(assignment_cells)} cells containing assignment name")
@@ -929,21 +1459,20 @@ class D2LDateProcessor:
                 for assignment_cell in assignment_cells:
                     try:
                         # Find the parent row
-                        parent_row = assignment_cell.find_element(By.XPATH, "./ancestor::tr")
-                        
-                        # Look for start date column specifically
-                        start_date_cells = parent_row.find_elements(By.XPATH, ".//td[contains(@class, 'd_dg_col_StartDate') or contains(@class, 'StartDate') or contains(@headers, 'StartDate')]")
+                        parent_row = self.driver.execute_script("return arguments[0].closest('tr');", assignment_cell)
                         
-                        for cell in start_date_cells:
-                            start_links = cell.find_elements(By.XPATH, ".//a")
-                            for link in start_links:
-                                link_text = link.text.strip()
-                                # Accept both actual dates AND dashes (empty date fields)
-                                if (any(pattern in link_text for pattern in ['2025', '2026', '/', 'PM', 'AM']) or 
-                                    link_text == '-' or link_text == ''):
-                                    self.logger.info(f"Found start date link (including dash): '{link_text}'")
-                                    return link
-                    except Exception as e:
+                        # Look for start date column links specifically; the
+                        # descendant selector folds the per-cell loop into one
+                        # query and the texts arrive in one wire call
+                        start_links = parent_row.find_elements(
+                            By.CSS_SELECTOR, "td[class*='StartDate'] a, td[headers*='StartDate'] a")
+                        for link, link_text in zip(start_links, self._batch_link_texts(start_links)):
+                            # Accept both actual dates AND dashes (empty date fields)
+                            if (_DATE_RE.search(link_text) or
+                                link_text == '-' or link_text == ''):
+                                self.logger.info(f"Found start date link (including dash): '{link_text}'")
+                                return link
+                    except (NoSuchElementException, StaleElementReferenceException) as e:
                         self.logger.info(f"Could not process assignment cell: {e}")
                         continue
             
@@ -954,13 +1483,112 @@ class D2LDateProcessor:
             self.logger.error(f"Error finding assignment start date link: {e}")
             return None
     
+    def _enter_frame(self, frame_ref, frame_id):
+        """switch_to.frame that no-ops when the driver is already inside the
+        frame identified by frame_id."""
+        if frame_id is not None and self._current_frame_id == frame_id:
+            return
+        self.driver.switch_to.frame(frame_ref)
+        self._current_frame_id = frame_id
+
+    def _leave_frame(self, force=False):
+        """switch_to.default_content that no-ops when already at the top.
+
+        Pass force=True from exception handlers, where the tracked context
+        may not reflect reality.
+        """
+        if self._current_frame_id is None and not force:
+            return
+        self.driver.switch_to.default_content()
+        self._current_frame_id = None
+
+    def _parse_date_time(self, new_date, new_time):
+        """Parse an 'M/D/YYYY' (or 'Month D, YYYY') date and a 12/24-hour
+        time string into (month, day, year, hour, minute) strings.
+
+        Raises ValueError on unparseable input so callers can log and bail.
+        """
+        m = _DATE_MDY_RE.match(new_date.strip())
+        if m:
+            month, day, year = m.groups()
+        else:
+            dt = datetime.strptime(new_date, '%B %d, %Y')
+            month, day, year = str(dt.month), str(dt.day), str(dt.year)
+
+        t = _TIME_RE.match(new_time.strip())
+        if not t:
+            raise ValueError(f"Unrecognized time format: '{new_time}'")
+        hour, minute, meridiem = t.group(1), t.group(2) or '0', t.group(3)
+        if meridiem:
+            h = int(hour)
+            if meridiem.upper() == 'PM':
+                hour = str(h + 12 if h != 12 else 12)
+            else:
+                hour = str(h if h != 12 else 0)
+        return month, day, year, hour, minute
+
+    def _find_date_iframe_index(self):
+        """Scan every iframe for the date fields in one JS call.
+
+        Returns the frame index to pass to switch_to.frame, or -1 when no
+        readable frame contains year/month/day inputs (cross-origin frames
+        are skipped by the try/catch).
+        """
+        try:
+            return self.driver.execute_script(self._pinned(_JS_FIND_DATE_IFRAME))
+        except Exception:
+            return -1
+
+    def _switch_to_date_iframe(self, iframes):
+        """Switch the driver into the iframe containing the date fields.
+
+        A single JS scan finds the right frame index instead of doing a
+        switch_to.frame + probe + default_content round-trip per candidate;
+        only when the scan comes up empty (e.g. a frame JS cannot read into)
+        does the old per-frame probe loop run. Returns True with the driver
+        left inside the matching frame.
+        """
+        # Reuse the frame index that worked for the previous row, verifying
+        # with the cheap field probe before trusting it
+        if self._date_iframe_index is not None:
+            try:
+                self._enter_frame(self._date_iframe_index, self._date_iframe_index)
+                if self.driver.execute_script(self._pinned(_JS_HAS_DATE_FIELDS)):
+                    return True
+                self._leave_frame()
+            except Exception:
+                try:
+                    self._leave_frame(force=True)
+                except Exception:
+                    pass
+            self._date_iframe_index = None
+
+        idx = self._find_date_iframe_index()
+        if idx >= 0:
+            self.logger.info(f"Found date fields in iframe {idx}")
+            self._enter_frame(idx, idx)
+            self._date_iframe_index = idx
+            return True
+
+        # Fallback: probe each frame individually
+        for i, iframe in enumerate(iframes):
+            self.logger.info(f"Switching to iframe {i}...")
+            self._enter_frame(iframe, ('probe', i))
+            has_date_fields = self.driver.execute_script(self._pinned(_JS_HAS_DATE_FIELDS))
+            if has_date_fields:
+                self.logger.info(f"Found date fields in iframe {i}!")
+                return True
+            self.logger.info(f"No date fields in iframe {i}, trying next...")
+            self._leave_frame()
+        return False
+
     def set_date_in_mini_editor(self, new_date, new_time):
         """Set date and time in the mini editor popup"""
         try:
             self.logger.info(f"Setting date to '{new_date}' and time to '{new_time}' in mini editor...")
             
             # Wait for dialog to appear
-            wait = WebDriverWait(self.driver, 10)
+            wait = self._wait(10)
             dialog = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[role='dialog']")))
             self.logger.info("SUCCESS: Dialog appeared")
             
@@ -972,26 +1600,10 @@ class D2LDateProcessor:
                 self.logger.error("No iframes found in dialog")
                 return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
             
-            # Try each iframe to find the one with date fields
-            for i, iframe in enumerate(iframes):
-                self.logger.info(f"Switching to iframe {i}...")
-                self.driver.switch_to.frame(iframe)
-                
-                # Check if this iframe contains date fields using JavaScript
-                has_date_fields = self.driver.execute_script("""
-                    var dateFields = document.querySelectorAll('input[name*="year"], input[name*="month"], input[name*="day"]');
-                    return dateFields.length > 0;
-                """)
-                
-                if has_date_fields:
-                    self.logger.info(f"Found date fields in iframe {i}!")
-                    break
-                else:
-                    self.logger.info(f"No date fields in iframe {i}, trying next...")
-                    self.driver.switch_to.default_content()
-            else:
+            # Locate the date-bearing iframe with one JS scan and switch once
+            if not self._switch_to_date_iframe(iframes):
                 self.logger.error("No iframe with date fields found")
-                self.driver.switch_to.default_content()
+                self._leave_frame()
                 return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
             
             # Now we're in the correct iframe - set the date
@@ -1000,8 +1612,8 @@ class D2LDateProcessor:
         except Exception as e:
             self.logger.error(f"Error setting date in mini editor: {e}")
             try:
-                self.driver.switch_to.default_content()
-            except:
+                self._leave_frame(force=True)
+            except Exception:
                 pass
             return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
     
@@ -1024,13 +1636,13 @@ class D2LDateProcessor:
             
             for selector_type, selector_value in dialog_selectors:
                 try:
-                    WebDriverWait(self.driver, 15).until(
+                    self._wait(15).until(
                         EC.presence_of_element_located((selector_type, selector_value))
                     )
                     self.logger.info(f"SUCCESS: Dialog found with selector: {selector_type} = '{selector_value}'")
                     dialog_found = True
                     break
-                except:
+                except TimeoutException:
                     continue
             
             if not dialog_found:
@@ -1045,26 +1657,10 @@ class D2LDateProcessor:
                 self.logger.error("No iframes found in dialog")
                 return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
             
-            # Try each iframe to find the one with date fields
-            for i, iframe in enumerate(iframes):
-                self.logger.info(f"Switching to iframe {i}...")
-                self.driver.switch_to.frame(iframe)
-                
-                # Check if this iframe contains date fields
-                has_date_fields = self.driver.execute_script("""
-                    var dateFields = document.querySelectorAll('input[name*="year"], input[name*="month"], input[name*="day"]');
-                    return dateFields.length > 0;
-                """)
-                
-                if has_date_fields:
-                    self.logger.info(f"Found date fields in iframe {i}!")
-                    break
-                else:
-                    self.logger.info(f"No date fields in iframe {i}, trying next...")
-                    self.driver.switch_to.default_content()
-            else:
+            # Locate the date-bearing iframe with one JS scan and switch once
+            if not self._switch_to_date_iframe(iframes):
                 self.logger.error("No iframe with date fields found")
-                self.driver.switch_to.default_content()
+                self._leave_frame()
                 return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
             
             # Now we're in the correct iframe - set the start date with start date checkbox
@@ -1073,8 +1669,8 @@ class D2LDateProcessor:
         except Exception as e:
             self.logger.error(f"Error setting start date in mini editor: {e}")
             try:
-                self.driver.switch_to.default_content()
-            except:
+                self._leave_frame(force=True)
+            except Exception:
                 pass
             return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
     
@@ -1083,175 +1679,38 @@ class D2LDateProcessor:
         try:
             self.logger.info(f"Setting date to '{new_date}' and time to '{new_time}' inside iframe...")
             
-            # Parse the date and time
+            # Parse the date and time with the precompiled patterns
             try:
-                if '/' in new_date:
-                    month, day, year = new_date.split('/')
-                else:
-                    from datetime import datetime
-                    dt = datetime.strptime(new_date, '%B %d, %Y')
-                    month, day, year = str(dt.month), str(dt.day), str(dt.year)
-                
-                # Parse time
-                if 'PM' in new_time.upper():
-                    time_part = new_time.upper().replace('PM', '').strip()
-                    if ':' in time_part:
-                        hour, minute = time_part.split(':')
-                    else:
-                        hour, minute = time_part, '0'
-                    hour = str(int(hour) + 12 if int(hour) != 12 else 12)
-                elif 'AM' in new_time.upper():
-                    time_part = new_time.upper().replace('AM', '').strip()
-                    if ':' in time_part:
-                        hour, minute = time_part.split(':')
-                    else:
-                        hour, minute = time_part, '0'
-                    hour = str(int(hour) if int(hour) != 12 else 0)
-                else:
-                    if ':' in new_time:
-                        hour, minute = new_time.split(':')
-                    else:
-                        hour, minute = new_time, '0'
-                
+                month, day, year, hour, minute = self._parse_date_time(new_date, new_time)
                 self.logger.info(f"Parsed date: {month}/{day}/{year}, time: {hour}:{minute}")
-                
             except Exception as e:
                 self.logger.error(f"Error parsing date/time: {e}")
                 return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
             
-            # STEP 1: Check appropriate checkbox
-            checkbox_result = {'found': False, 'wasUnchecked': False, 'nowChecked': False}
-            
+            # STEP 1+2: check the checkbox and set date/time fields in one
+            # JS round trip; the script reports checkbox state alongside the
+            # usual result dict
             if checkbox_id:
                 checkbox_selector = checkbox_id
                 checkbox_name = "Has Start Date" if checkbox_id == "z_o" else "Has Due Date"
             else:
                 checkbox_selector = "z_k"
                 checkbox_name = "Has Due Date"
-            
-            try:
-                self.logger.info(f"Looking for '{checkbox_name}' checkbox (#{checkbox_selector})")
-                checkbox = self.driver.find_element(By.ID, checkbox_selector)
-                checkbox_result['found'] = True
-                
-                is_checked = checkbox.is_selected()
-                if is_checked:
-                    self.logger.info(f"Checkbox is already checked")
-                    checkbox_result['nowChecked'] = True
-                else:
-                    self.logger.info(f"Clicking checkbox to enable date fields...")
-                    checkbox_result['wasUnchecked'] = True
-                    
-                    if checkbox_id == "z_o":
-                        # Start date checkbox - use D2L event system
-                        try:
-                            self.driver.execute_script("""
-                                var checkbox = arguments[0];
-                                checkbox.checked = true;
-                                checkbox.dispatchEvent(new Event('change', { bubbles: true }));
-                                checkbox.dispatchEvent(new Event('input', { bubbles: true }));
-                            """, checkbox)
-                            time.sleep(0.2)
-                            
-                            if checkbox.is_selected():
-                                self.logger.info("Checkbox activated successfully!")
-                                checkbox_result['nowChecked'] = True
-                            else:
-                                self.logger.error("Checkbox activation failed")
-                                checkbox_result['nowChecked'] = False
-                        except Exception as e:
-                            self.logger.error(f"Checkbox click error: {e}")
-                            checkbox_result['nowChecked'] = False
-                    else:
-                        # Due date checkbox - standard click
-                        try:
-                            checkbox.click()
-                            time.sleep(0.2)
-                            
-                            if checkbox.is_selected():
-                                self.logger.info("Checkbox clicked successfully!")
-                                checkbox_result['nowChecked'] = True
-                            else:
-                                self.logger.error("Checkbox click failed")
-                                checkbox_result['nowChecked'] = False
-                        except Exception as e:
-                            self.logger.error(f"Checkbox click error: {e}")
-                            checkbox_result['nowChecked'] = False
-                            
-            except Exception as e:
-                self.logger.error(f"Checkbox not found: {e}")
-                checkbox_result['found'] = False
-                return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0, 'checkboxResult': checkbox_result}
-            
-            # If checkbox was required but not checked, abort
+
+            self.logger.info(f"Looking for '{checkbox_name}' checkbox (#{checkbox_selector})")
+            result = self.driver.execute_script(
+                self._pinned(_JS_SET_DATETIME), checkbox_selector,
+                month, day, year, hour, minute, bool(checkbox_id))
+
+            checkbox_result = result.get('checkboxResult', {})
+            if not checkbox_result.get('found'):
+                self.logger.error("Checkbox not found")
+                return result
             if checkbox_id and not checkbox_result.get('nowChecked', False):
                 self.logger.error("Checkbox activation failed - cannot proceed")
-                return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0, 'checkboxResult': checkbox_result}
-            
-            # STEP 2: Set date/time
-            result = self.driver.execute_script("""
-                const month = arguments[0];
-                const day = arguments[1]; 
-                const year = arguments[2];
-                const hour = arguments[3];
-                const minute = arguments[4];
-                
-                const yearField = document.querySelector('input[name*="$year"]');
-                const monthField = document.querySelector('input[name*="$month"]');  
-                const dayField = document.querySelector('input[name*="$day"]');
-                const hourField = document.querySelector('input[name*="$hour"]');
-                const minuteField = document.querySelector('input[name*="$minute"]');
-                
-                let dateFound = false;
-                let dateSet = false;
-                let timeFound = false;
-                let timeSet = false;
-                
-                if (yearField && monthField && dayField) {
-                    dateFound = true;
-                    try {
-                        yearField.value = year;
-                        monthField.value = month;
-                        dayField.value = day;
-                        
-                        [yearField, monthField, dayField].forEach(field => {
-                            field.dispatchEvent(new Event('input', { bubbles: true }));
-                            field.dispatchEvent(new Event('change', { bubbles: true }));
-                        });
-                        
-                        dateSet = true;
-                    } catch (e) {
-                        console.error('Error setting date:', e);
-                    }
-                }
-                
-                if (hourField && minuteField) {
-                    timeFound = true;
-                    try {
-                        hourField.value = hour;
-                        minuteField.value = minute;
-                        
-                        [hourField, minuteField].forEach(field => {
-                            field.dispatchEvent(new Event('input', { bubbles: true }));
-                            field.dispatchEvent(new Event('change', { bubbles: true }));
-                        });
-                        
-                        timeSet = true;
-                    } catch (e) {
-                        console.error('Error setting time:', e);
-                    }
-                }
-                
-                return {
-                    dateFound: dateFound,
-                    dateSet: dateSet,
-                    timeFound: timeFound,
-                    timeSet: timeSet,
-                    totalElements: (yearField ? 1 : 0) + (monthField ? 1 : 0) + (dayField ? 1 : 0) + (hourField ? 1 : 0) + (minuteField ? 1 : 0)
-                };
-            """, month, day, year, hour, minute)
-            
-            result['checkboxResult'] = checkbox_result
+                return result
+            if checkbox_result.get('wasUnchecked') and checkbox_result.get('nowChecked'):
+                self.logger.info("Checkbox activated successfully!")
             
             if result['dateSet']:
                 self.logger.info(f"Successfully set date to {month}/{day}/{year}")
@@ -1260,29 +1719,28 @@ class D2LDateProcessor:
             
             # STEP 3: Click Save button
             try:
-                self.driver.switch_to.default_content()
-                
-                save_selectors = [
-                    "//button[text()='Save']",
-                    "//div[@class='ddial_o']//button[1]",
-                    "//button[contains(text(), 'Save')]",
-                ]
-                
-                save_clicked = False
-                for selector in save_selectors:
-                    try:
-                        save_button = self.driver.find_element(By.XPATH, selector)
-                        if save_button.is_displayed() and save_button.is_enabled():
-                            save_button.click()
-                            self.logger.info("Clicked Save button")
-                            save_clicked = True
-                            break
-                    except:
-                        continue
-                
+                # Click Save through window.parent.document while still inside
+                # the iframe, so the save fires before the context switch; on
+                # a cross-origin parent fall back to leaving the frame first
+                save_clicked = bool(self.driver.execute_script(
+                    self._pinned(_JS_CLICK_SAVE_PARENT)))
+                self._leave_frame()
+                if not save_clicked:
+                    save_clicked = bool(self.driver.execute_script(self._pinned(_JS_CLICK_SAVE)))
+                if save_clicked:
+                    self.logger.info("Clicked Save button")
+
                 result['saveClicked'] = save_clicked
-                time.sleep(0.5)
-                    
+                if save_clicked:
+                    # Wait for the dialog to actually close rather than
+                    # sleeping a worst-case amount
+                    try:
+                        self._wait(5, poll_frequency=0.1).until(
+                            EC.invisibility_of_element_located((By.CSS_SELECTOR, "[role='dialog']"))
+                        )
+                    except TimeoutException:
+                        self.logger.warning("Dialog still visible after Save; continuing")
+
             except Exception as e:
                 self.logger.warning(f"Error clicking Save: {e}")
                 result['saveClicked'] = False
@@ -1292,8 +1750,8 @@ class D2LDateProcessor:
         except Exception as e:
             self.logger.error(f"Error in set_date_in_iframe: {e}")
             try:
-                self.driver.switch_to.default_content()
-            except:
+                self._leave_frame(force=True)
+            except Exception:
                 pass
             return {'dateFound': False, 'dateSet': False, 'timeFound': False, 'timeSet': False, 'totalElements': 0}
 
@@ -1306,8 +1764,14 @@ class D2LDateProcessorGUI:
         
         self.automation = None
         self.csv_file_path = None
-        
+
+        # Status messages are queued and drained on a 100ms timer so a burst
+        # of log lines costs one text-widget insert instead of one Tk event
+        # pump per line
+        self._log_queue = queue.Queue()
+
         self.create_widgets()
+        self.root.after(100, self._drain_log)
         
     def create_widgets(self):
         """Create the GUI widgets"""
@@ -1351,17 +1815,20 @@ class D2LDateProcessorGUI:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=0, columnspan=3, pady=10)
         
+        # pack() keeps the row layout declarative: adding a button later is a
+        # single pack call rather than renumbering grid columns, and Tk skips
+        # the per-cell grid geometry recomputation during first paint.
         self.login_button = ttk.Button(button_frame, text="Login to D2L", command=self.login_to_d2l)
-        self.login_button.grid(row=0, column=0, padx=5)
-        
+        self.login_button.pack(side=tk.LEFT, padx=5)
+
         self.process_button = ttk.Button(button_frame, text="Process CSV", command=self.process_csv, state=tk.DISABLED)
-        self.process_button.grid(row=0, column=1, padx=5)
-        
+        self.process_button.pack(side=tk.LEFT, padx=5)
+
         self.clear_button = ttk.Button(button_frame, text="Clear Login", command=self.clear_login)
-        self.clear_button.grid(row=0, column=2, padx=5)
-        
+        self.clear_button.pack(side=tk.LEFT, padx=5)
+
         self.exit_button = ttk.Button(button_frame, text="Exit", command=self.exit_app)
-        self.exit_button.grid(row=0, column=3, padx=5)
+        self.exit_button.pack(side=tk.LEFT, padx=5)
         
         # Status frame
         status_frame = ttk.LabelFrame(main_frame, text="Status", padding="5")
@@ -1392,29 +1859,56 @@ class D2LDateProcessorGUI:
             self.update_status(f"Selected CSV file: {os.path.basename(file_path)}")
         
     def update_status(self, message):
-        """Update the status label and log"""
-        self.status_var.set(message)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        """Queue a message for the status label and log"""
+        self._log_queue.put(message)
+
+    def _drain_log(self):
+        """Flush all queued status messages in one widget update"""
+        messages = []
+        while True:
+            try:
+                messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            self.status_var.set(messages[-1])
+            self.log_text.insert(tk.END, '\n'.join(messages) + '\n')
+            self.log_text.see(tk.END)
+        self.root.after(100, self._drain_log)
     
     def login_to_d2l(self):
         """Handle login process"""
         try:
             self.update_status("Initializing Chrome driver...")
-            
+
             if not hasattr(self, 'automation') or self.automation is None:
                 self.automation = D2LDateProcessor()
-            
-            if not self.automation.setup_driver():
+
+            # Reuse a live driver from a previous login instead of paying the
+            # full Chrome + profile startup cost again; the persistent profile
+            # already holds the auth session.
+            if self.automation.driver is not None:
+                try:
+                    _ = self.automation.driver.current_url
+                    self.update_status("Reusing existing browser session...")
+                except Exception:
+                    # Driver died (browser closed); start a fresh one
+                    self.automation.driver = None
+
+            if self.automation.driver is None and not self.automation.setup_driver():
                 self.update_status("Failed to initialize driver")
                 return
-            
+
             d2l_url = self.url_var.get()
             self.update_status(f"Navigating to: {d2l_url}")
             self.automation.driver.get(d2l_url)
-            time.sleep(2)
-            
+            # Wait for the document to finish loading instead of a fixed 2s
+            try:
+                self.automation._wait(15, poll_frequency=0.1).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete")
+            except TimeoutException:
+                self.update_status("Page still loading; continuing anyway")
+
             self.update_status("Login successful! Navigate to 'Manage Dates' page")
             self.process_button.config(state=tk.NORMAL)
             self.update_status("Ready for CSV processing!")
@@ -1424,30 +1918,42 @@ class D2LDateProcessorGUI:
     
     def process_csv(self):
         """Process the CSV file"""
+        if not self.csv_file_path:
+            messagebox.showerror("Error", "Please select a CSV file first")
+            return
+
+        if not self.automation or not self.automation.driver:
+            messagebox.showerror("Error", "Please login to D2L first")
+            return
+
+        # Run the Selenium work off the Tk thread so the window stays
+        # responsive; status lines flow back through the log queue
+        self.process_button.config(state=tk.DISABLED)
+        self.update_status("Starting CSV processing...")
+        threading.Thread(target=self._process_csv_worker, daemon=True).start()
+
+    def _process_csv_worker(self):
+        """Background worker for process_csv; reports back via root.after"""
         try:
-            if not self.csv_file_path:
-                messagebox.showerror("Error", "Please select a CSV file first")
-                return
-            
-            if not self.automation or not self.automation.driver:
-                messagebox.showerror("Error", "Please login to D2L first")
-                return
-            
-            self.update_status("Starting CSV processing...")
-            
             processed, errors = self.automation.process_csv_file(self.csv_file_path)
-            
-            if errors == 0:
-                self.update_status(f"Success! Processed {processed} assignments")
-                messagebox.showinfo("Success", f"Successfully processed {processed} assignments!")
-            else:
-                self.update_status(f"Completed: {processed} processed, {errors} errors")
-                messagebox.showwarning("Completed with Errors", f"Processed {processed}, but {errors} had errors.")
-                
+            self.root.after(0, self._process_csv_done, processed, errors, None)
         except Exception as e:
-            self.update_status(f"CSV processing error: {e}")
-            messagebox.showerror("Error", f"CSV processing failed: {e}")
-    
+            self.root.after(0, self._process_csv_done, 0, 0, e)
+
+    def _process_csv_done(self, processed, errors, exc):
+        """Show the outcome on the Tk thread and re-enable the button"""
+        self.process_button.config(state=tk.NORMAL)
+        if exc is not None:
+            self.update_status(f"CSV processing error: {exc}")
+            messagebox.showerror("Error", f"CSV processing failed: {exc}")
+        elif errors == 0:
+            self.update_status(f"Success! Processed {processed} assignments")
+            messagebox.showinfo("Success", f"Successfully processed {processed} assignments!")
+        else:
+            self.update_status(f"Completed: {processed} processed, {errors} errors")
+            messagebox.showwarning("Completed with Errors", f"Processed {processed}, but {errors} had errors.")
+
+
     def clear_login(self):
         """Clear saved login session"""
         try:
@@ -1457,10 +1963,9 @@ class D2LDateProcessorGUI:
                 self.automation.driver.quit()
                 self.automation = None
             
-            import tempfile
             profile_dir = os.path.join(tempfile.gettempdir(), "d2l_chrome_profile")
             if os.path.exists(profile_dir):
-                shutil.rmtree(profile_dir)
+                _fast_rmtree(profile_dir)
                 self.update_status("Login session cleared!")
             else:
                 self.update_status("No saved session found")
@@ -1485,21 +1990,92 @@ class D2LDateProcessorGUI:
         self.root.mainloop()
 
 
+def _fast_rmtree(root):
+    """Delete a directory tree using parallel file unlinks.
+
+    A Chrome profile holds tens of thousands of small cache files, which makes
+    serial shutil.rmtree a multi-second syscall storm on Windows. File deletes
+    are I/O-bound and release the GIL, so they are fanned out to a thread pool
+    first, then the emptied directories are removed bottom-up.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    directories = []
+    files = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        directories.append(path)
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            continue
+
+    def _unlink(path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(_unlink, files))
+
+    # Longest paths first so children are removed before their parents
+    for path in sorted(directories, key=len, reverse=True):
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+
+
 def cleanup_existing_processes():
     """Clean up any existing Chrome/ChromeDriver processes"""
+    # Kill the chromedriver recorded by the previous run directly (O(1))
+    # before sweeping by image name for orphaned browser processes
+    import signal
     try:
-        try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'] in ['chrome.exe', 'chromedriver.exe']:
+        with open(_PIDFILE) as pid_file:
+            pid = int(pid_file.read().strip())
+        os.kill(pid, signal.SIGTERM)
+    except (OSError, ValueError):
+        pass
+    try:
+        os.remove(_PIDFILE)
+    except OSError:
+        pass
+
+    # Let the OS tool filter by image name kernel-side: two fork+execs
+    # instead of reading name/pid for every process on the machine.
+    import subprocess
+    import sys
+    try:
+        if sys.platform == 'win32':
+            for image in ('chrome.exe', 'chromedriver.exe'):
+                subprocess.run(['taskkill', '/F', '/IM', image],
+                               capture_output=True)
+        else:
+            for pattern in ('chromedriver', 'chrome'):
+                subprocess.run(['pkill', '-f', pattern], capture_output=True)
+        return
+    except OSError:
+        pass
+
+    # Fallback when the OS tool is unavailable: in-process psutil sweep
+    try:
+        import psutil
+
+        for proc in psutil.process_iter(['pid', 'name']):
+            if proc.info['name'] in ('chrome.exe', 'chromedriver.exe'):
+                try:
                     proc.kill()
-        except ImportError:
-            try:
-                subprocess.run(['taskkill', '/F', '/IM', 'chromedriver.exe'], capture_output=True, text=True)
-                subprocess.run(['taskkill', '/F', '/IM', 'chrome.exe'], capture_output=True, text=True)
-            except:
-                pass
-    except:
+                except psutil.Error:
+                    pass
+    except Exception:
         pass
 
 
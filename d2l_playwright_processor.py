@@ -218,12 +218,13 @@ add that logic without disrupting existing features.
 import sys
 import os
 import json
+import atexit
 import asyncio
 import logging
 import traceback
 import subprocess
 from datetime import datetime
-from playwright.async_api import async_playwright
+from types import MappingProxyType
 
 # ========================================
 # 🔧 CONFIGURATION
@@ -231,13 +232,22 @@ from playwright.async_api import async_playwright
 SHARED_BROWSER_DIR = r"C:\Users\chase\Documents\Shared-Browser-Data"
 D2L_BASE_URL = "https://d2l.lonestar.edu/"
 
-COURSE_URLS = {
+# Read-only view: the course table is fixed configuration, and freezing it
+# both documents that and guards against accidental mutation at runtime.
+COURSE_URLS = MappingProxyType({
     "FM4202": "https://d2l.lonestar.edu/d2l/lms/manageDates/date_manager.d2l?fromCMC=1&ou=1580392",
     "FM4103": "https://d2l.lonestar.edu/d2l/lms/manageDates/date_manager.d2l?fromCMC=1&ou=1580390",
     "CA4203": "https://d2l.lonestar.edu/d2l/lms/manageDates/date_manager.d2l?fromCMC=1&ou=1580436",
     "CA4201": "https://d2l.lonestar.edu/d2l/lms/manageDates/date_manager.d2l?fromCMC=1&ou=1580434",
     "CA4105": "https://d2l.lonestar.edu/d2l/lms/manageDates/date_manager.d2l?fromCMC=1&ou=1580431",
-}
+})
+
+# Resource types and tracker hosts blocked during automation.  The macro only
+# reads the Date Manager grid, so images, fonts, media and analytics beacons
+# are wasted bytes on every navigation.  Documents, scripts, stylesheets and
+# XHR/fetch are left alone so the grid still renders and behaves normally.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_URL_SNIPPETS = ("google-analytics", "googletagmanager", "doubleclick", "fullstory")
 
 # Centralized logs folder
 LOGS_DIR = r"C:\Users\chase\Documents\School Scrips\Logs"
@@ -270,6 +280,13 @@ logger = logging.getLogger(__name__)
 
 
 class D2LProcessor:
+    # Shared event loop reused across run_automation calls.  asyncio.run()
+    # creates and tears down a brand-new loop (plus its selector machinery)
+    # on every invocation, which adds needless startup cost when the same
+    # process runs several automations and risks Playwright handles being
+    # bound to a dead loop.  One loop is created lazily and closed at exit.
+    _loop = None
+
     def __init__(self):
         self.playwright = None
         self.browser = None
@@ -279,6 +296,9 @@ class D2LProcessor:
         self.assignments_processed = 0
         # Track if we're using CDP (external browser) - don't close context in this case
         self.using_cdp = False
+        # Strong reference to the background prefetch task; the event loop
+        # only holds tasks weakly, so an anonymous task could be collected
+        self._prefetch_task = None
 
     async def automate_d2l(self, action=None, course_code=None, csv_path=None):
         """
@@ -311,12 +331,16 @@ class D2LProcessor:
         """
         try:
             logger.info("🚀 Starting D2L automation (attach-only mode)...")
+            # Imported here rather than at module scope: playwright is a heavy
+            # import and only the automation path needs it, so the CLI starts
+            # (and can print usage/log errors) without paying for it.
+            from playwright.async_api import async_playwright
             self.playwright = await async_playwright().start()
 
             # ===========================================================
             # 🧩 CONNECT TO EXISTING CHROME ONLY
             # ===========================================================
-            await asyncio.sleep(0.5)
+            await self._wait_for_cdp_endpoint("http://localhost:9223/json/version")
             try:
                 logger.info("🔗 Connecting to existing Chrome session on port 9223...")
                 browser = await self.playwright.chromium.connect_over_cdp("http://localhost:9223")
@@ -325,6 +349,7 @@ class D2LProcessor:
                 self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
                 self.using_cdp = True  # Mark that we're using external browser
                 logger.info("✅ Attached to existing Chrome session (no relaunch).")
+                await self._block_unneeded_resources(self.page)
             except Exception as e:
                 logger.error(f"❌ Could not connect to existing browser: {e}")
                 raise RuntimeError("Chrome must be opened first via the Login button.")
@@ -336,6 +361,8 @@ class D2LProcessor:
                 # Skip homepage reload — directly open the course
                 logger.info(f"🎯 Opening course directly: {course_code}")
                 await self.open_course(course_code)
+                # Warm the other courses while the user works in this one
+                self._prefetch_task = asyncio.create_task(self._prefetch_courses(course_code))
                 # Hold the page open so the user can interact manually
                 logger.info("🕓 Holding browser open after opening course (open-course mode).")
                 await asyncio.Event().wait()
@@ -345,9 +372,21 @@ class D2LProcessor:
                 await self.process_course(course_code, csv_path)
             else:
                 # Normal login flow — go to D2L home page
-                logger.info(f"🌍 Navigating to D2L base URL: {D2L_BASE_URL}")
-                await self.page.goto(D2L_BASE_URL, wait_until="networkidle")
-                await asyncio.sleep(3)
+                # Skip the navigation entirely when the attached tab is already
+                # somewhere on D2L — re-running login mode should not force a
+                # full page reload for no semantic change.
+                if self.page.url.startswith(D2L_BASE_URL):
+                    logger.info(f"✅ Already on D2L: {self.page.url}")
+                else:
+                    logger.info(f"🌍 Navigating to D2L base URL: {D2L_BASE_URL}")
+                    # 'networkidle' waits for 500ms of total network silence, which
+                    # D2L's analytics beacons and long-polling can stretch out for
+                    # seconds.  DOM-ready plus a visible-body wait is enough here.
+                    await self.page.goto(D2L_BASE_URL, wait_until="domcontentloaded")
+                    try:
+                        await self.page.wait_for_selector("body", state="visible", timeout=15000)
+                    except Exception:
+                        logger.warning("⚠️ Page body not confirmed visible; continuing anyway.")
                 logger.info("✅ Browser ready for manual login.")
                 logger.info("🕓 Holding browser open indefinitely (login mode).")
                 await asyncio.Event().wait()
@@ -356,6 +395,96 @@ class D2LProcessor:
             self._write_debug_report("automate_d2l", e)
             raise
 
+    async def _block_unneeded_resources(self, page):
+        """
+        Register a route filter that aborts requests for resource types and
+        tracker hosts the automation never reads. Cuts per-navigation
+        bandwidth and request count without affecting the Date Manager grid.
+        """
+        async def _route_filter(route):
+            request = route.request
+            if request.resource_type in BLOCKED_RESOURCE_TYPES or \
+                    any(snippet in request.url for snippet in BLOCKED_URL_SNIPPETS):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        try:
+            await page.route("**/*", _route_filter)
+            logger.info("🚫 Resource blocking enabled (images/fonts/media/trackers).")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not register resource blocking: {e}")
+
+    async def _prefetch_courses(self, opened_code: str):
+        """
+        Warm Chrome's HTTP cache for the other known courses using background
+        pages. Users editing a term typically open each class in sequence, so
+        the next course's goto is then served largely from cache. Concurrency
+        is capped at two pages so the prefetch never competes with the
+        foreground tab, and failures are logged and swallowed.
+
+        Parameters
+        ----------
+        opened_code : str
+            The course code (or URL) that was just opened; it is skipped.
+        """
+        # open_course accepts either a COURSE_URLS key or a raw URL, so skip
+        # by resolved URL - comparing codes alone would re-fetch the course
+        # that is already open in the foreground when a URL was passed
+        opened_url = COURSE_URLS.get(opened_code, opened_code)
+        semaphore = asyncio.Semaphore(2)
+
+        async def _warm(code, url):
+            async with semaphore:
+                try:
+                    bg_page = await self.context.new_page()
+                    try:
+                        await bg_page.goto(url, wait_until='domcontentloaded')
+                    finally:
+                        await bg_page.close()
+                    logger.info(f"🔥 Prefetched course {code} in the background.")
+                except Exception as e:
+                    logger.debug(f"⚠️ Prefetch of {code} failed: {e}")
+
+        await asyncio.gather(*(
+            _warm(code, url)
+            for code, url in COURSE_URLS.items()
+            if url != opened_url
+        ))
+
+    async def _wait_for_cdp_endpoint(self, url: str, timeout: float = 10.0):
+        """
+        Poll the Chrome remote-debugging endpoint until it responds instead of
+        sleeping a fixed amount before attaching. This connects as soon as the
+        browser is actually ready and tolerates slow Chrome startups that a
+        blind delay would miss.
+
+        Parameters
+        ----------
+        url : str
+            The CDP HTTP endpoint to poll (e.g. ``http://localhost:9223/json/version``).
+        timeout : float, optional
+            Maximum number of seconds to keep polling before giving up and
+            letting the subsequent connect attempt report the real error.
+        """
+        import urllib.request
+        import urllib.error
+        deadline = asyncio.get_event_loop().time() + timeout
+        while True:
+            try:
+                # urlopen is blocking but each probe is quick; run it off-loop
+                # so the event loop stays responsive.
+                await asyncio.get_event_loop().run_in_executor(
+                    None, lambda: urllib.request.urlopen(url, timeout=1).close()
+                )
+                logger.info("✅ Chrome debug endpoint is ready.")
+                return
+            except Exception:
+                if asyncio.get_event_loop().time() >= deadline:
+                    logger.warning("⚠️ Chrome debug endpoint did not respond in time; attempting connect anyway.")
+                    return
+                await asyncio.sleep(0.1)
+
     async def open_course(self, course_code: str):
         """
         Navigate to a specific course page. Accepts either a course code (key in
@@ -374,8 +503,13 @@ class D2LProcessor:
             # Only navigate if we aren't already on the target page
             current_url = page.url
             if not current_url.startswith(url):
-                await page.goto(url, wait_until='networkidle')
-                await asyncio.sleep(3)
+                # Avoid 'networkidle': wait for DOM-ready plus the actual Date
+                # Manager table instead of 500ms of network silence.
+                await page.goto(url, wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector("//td[contains(@class,'d_dg_col_Name')]", timeout=15000)
+                except Exception:
+                    logger.warning("⚠️ Date Manager table not confirmed visible; continuing anyway.")
             else:
                 logger.info(f"✅ Already on target page: {current_url}")
             logger.info(f"✅ Course {course_code} loaded successfully.")
@@ -457,59 +591,30 @@ class D2LProcessor:
             assignments: list[dict] = []
             if csv_path and os.path.isfile(csv_path):
                 try:
-                    # Attempt to use pandas if available for flexible parsing
-                    try:
-                        import pandas as pd  # type: ignore
-                        df = pd.read_csv(csv_path)
-                        logger.info(f"📄 CSV loaded: {len(df)} rows")
-                        for idx, row in df.iterrows():
-                            # Support both 'Assignment Name' and legacy 'Name' headers
-                            assignment = str(row.get('Assignment Name') or row.get('Name') or '').strip()
-                            # Standard date fields
-                            start_date = str(row.get('Start Date') or row.get('Start') or '').strip()
-                            due_date = str(row.get('Due Date') or row.get('Due') or '').strip()
-                            end_date = str(row.get('End Date') or row.get('End') or '').strip()
-                            # Time fields may be missing; try multiple headers
-                            start_time = str(row.get('Start Time') or row.get('Start Time (Local)') or '').strip()
-                            due_time = str(row.get('Due Time') or row.get('Due Time (Local)') or '').strip()
-                            logger.info(
-                                f"🔍 [Row {idx+1}] assignment='{assignment}', start='{start_date}'{f' {start_time}' if start_time else ''}, due='{due_date}'{f' {due_time}' if due_time else ''}, end='{end_date}'"
-                            )
-                            assignments_processed += 1
-                            assignments.append({
-                                'assignment': assignment,
-                                'start_date': start_date,
-                                'start_time': start_time,
-                                'due_date': due_date,
-                                'due_time': due_time,
-                                'end_date': end_date
-                            })
-                    except ImportError:
-                        # Fallback to csv module if pandas isn't available
-                        import csv as csv_module
-                        with open(csv_path, newline='', encoding='utf-8') as csvfile:
-                            reader = csv_module.DictReader(csvfile)
-                            rows = list(reader)
-                        logger.info(f"📄 CSV loaded: {len(rows)} rows")
-                        for idx, row in enumerate(rows):
-                            assignment = (row.get('Assignment Name') or row.get('Name') or '').strip()
-                            start_date = (row.get('Start Date') or row.get('Start') or '').strip()
-                            due_date = (row.get('Due Date') or row.get('Due') or '').strip()
-                            end_date = (row.get('End Date') or row.get('End') or '').strip()
-                            start_time = (row.get('Start Time') or row.get('Start Time (Local)') or '').strip()
-                            due_time = (row.get('Due Time') or row.get('Due Time (Local)') or '').strip()
-                            logger.info(
-                                f"🔍 [Row {idx+1}] assignment='{assignment}', start='{start_date}'{f' {start_time}' if start_time else ''}, due='{due_date}'{f' {due_time}' if due_time else ''}, end='{end_date}'"
-                            )
-                            assignments_processed += 1
-                            assignments.append({
-                                'assignment': assignment,
-                                'start_date': start_date,
-                                'start_time': start_time,
-                                'due_date': due_date,
-                                'due_time': due_time,
-                                'end_date': end_date
-                            })
+                    rows = self._read_csv_rows(csv_path)
+                    logger.info(f"📄 CSV loaded: {len(rows)} rows")
+                    for idx, row in enumerate(rows):
+                        # Support both 'Assignment Name' and legacy 'Name' headers
+                        assignment = str(row.get('Assignment Name') or row.get('Name') or '').strip()
+                        # Standard date fields
+                        start_date = str(row.get('Start Date') or row.get('Start') or '').strip()
+                        due_date = str(row.get('Due Date') or row.get('Due') or '').strip()
+                        end_date = str(row.get('End Date') or row.get('End') or '').strip()
+                        # Time fields may be missing; try multiple headers
+                        start_time = str(row.get('Start Time') or row.get('Start Time (Local)') or '').strip()
+                        due_time = str(row.get('Due Time') or row.get('Due Time (Local)') or '').strip()
+                        logger.info(
+                            f"🔍 [Row {idx+1}] assignment='{assignment}', start='{start_date}'{f' {start_time}' if start_time else ''}, due='{due_date}'{f' {due_time}' if due_time else ''}, end='{end_date}'"
+                        )
+                        assignments_processed += 1
+                        assignments.append({
+                            'assignment': assignment,
+                            'start_date': start_date,
+                            'start_time': start_time,
+                            'due_date': due_date,
+                            'due_time': due_time,
+                            'end_date': end_date
+                        })
                 except Exception as csv_err:
                     logger.error(f"❌ Error reading CSV at {csv_path}: {csv_err}")
             else:
@@ -538,6 +643,76 @@ class D2LProcessor:
             self._write_debug_report("process_course", e)
             raise
 
+    def _read_csv_rows(self, csv_path: str):
+        """
+        Read the schedule CSV and return its rows as a list of plain dicts.
+
+        Small files (the typical per-class date CSV) go straight through the
+        stdlib csv module: building a columnar table or DataFrame for a few
+        dozen rows costs more in import and allocation than the parse itself.
+        Larger files prefer pyarrow's parallel CSV reader — it tokenizes in a
+        single pass with no object-dtype duplication, and ``to_pylist`` hands
+        back exactly the row dicts the update loop consumes — then pandas,
+        then the stdlib csv module as the final fallback so the script works
+        with no third-party parser at all.
+
+        Parameters
+        ----------
+        csv_path : str
+            Path to the CSV file containing schedule data.
+
+        Returns
+        -------
+        list[dict]
+            One dict per CSV row, keyed by the original column headers.
+        """
+        # ~1 MB covers thousands of schedule rows; anything under that is not
+        # worth a third-party parser.
+        try:
+            small_file = os.path.getsize(csv_path) < 1_000_000
+        except OSError:
+            small_file = True
+        if small_file:
+            import csv as csv_module
+            with open(csv_path, newline='', encoding='utf-8') as csvfile:
+                return list(csv_module.DictReader(csvfile))
+        try:
+            import pyarrow.csv as pacsv  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+            import hashlib
+            # Content-addressed parquet sidecar: repeated runs over the same
+            # big CSV load the already-parsed table instead of re-tokenizing.
+            # The hash covers the file bytes, so edits invalidate naturally.
+            sha = hashlib.sha1()
+            with open(csv_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    sha.update(chunk)
+            cache_dir = os.path.join(os.path.expanduser("~"), ".d2l_macro_cache")
+            cache_path = os.path.join(cache_dir, f"{sha.hexdigest()}.parquet")
+            if os.path.isfile(cache_path):
+                logger.info(f"📄 Loading parsed CSV from cache: {cache_path}")
+                return pq.read_table(cache_path).to_pylist()
+            tbl = pacsv.read_csv(
+                csv_path,
+                read_options=pacsv.ReadOptions(use_threads=True)
+            )
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                pq.write_table(tbl, cache_path, compression='zstd')
+            except Exception as cache_err:
+                logger.debug(f"⚠️ Could not write CSV cache: {cache_err}")
+            return tbl.to_pylist()
+        except ImportError:
+            pass
+        try:
+            import pandas as pd  # type: ignore
+            return pd.read_csv(csv_path).to_dict(orient='records')
+        except ImportError:
+            pass
+        import csv as csv_module
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            return list(csv_module.DictReader(csvfile))
+
     def run_automation(self, action=None, course_code=None, csv_path=None):
         """
         Launch the automation coroutine and handle cleanup. The optional
@@ -546,8 +721,10 @@ class D2LProcessor:
         """
         try:
             logger.info("🧠 Starting D2L automation process...")
-            # Run the async function and handle cleanup within the same event loop
-            asyncio.run(self._run_with_cleanup(action, course_code, csv_path))
+            # Run the async function and handle cleanup within the same event loop.
+            # The loop persists between calls so repeated runs skip loop setup.
+            loop = self._ensure_loop()
+            loop.run_until_complete(self._run_with_cleanup(action, course_code, csv_path))
             logger.info("✅ D2L Automation completed successfully.")
             return True
         except SystemExit as e:
@@ -557,6 +734,18 @@ class D2LProcessor:
             logger.error(f"❌ D2L Automation error: {str(e)}")
             return False
 
+    @classmethod
+    def _ensure_loop(cls):
+        """
+        Return the shared event loop, creating it on first use. The loop is
+        registered for closure at interpreter exit so handles are released
+        cleanly without paying the per-run teardown cost of ``asyncio.run``.
+        """
+        if cls._loop is None or cls._loop.is_closed():
+            cls._loop = asyncio.new_event_loop()
+            atexit.register(cls._loop.close)
+        return cls._loop
+
     async def _run_with_cleanup(self, action, course_code, csv_path):
         """
         Run the automation and handle cleanup within the same async context.
@@ -602,7 +791,9 @@ class D2LProcessor:
                 f.write(traceback.format_exc())
             logger.error(f"❌ Error at {stage}: {exception}")
             logger.info(f"Debug log saved at: {debug_path}")
-            subprocess.Popen(['notepad.exe', debug_path], shell=True)
+            # No shell=True: the args are already a list, so going through
+            # cmd.exe would only add an extra process and string re-parsing.
+            subprocess.Popen(['notepad.exe', debug_path])
         except Exception as log_err:
             print(f"Failed to write debug log: {log_err}")
 
@@ -819,6 +1010,28 @@ class D2LProcessor:
         if fully_normalized.lower() not in [s.lower() for s in selectors]:
             selectors.append(fully_normalized)
         
+        # Pull every candidate link's text back in ONE JS round-trip instead
+        # of a text_content() call per link per search term; the matching then
+        # happens entirely in Python against the cached texts.
+        try:
+            link_texts = await page.eval_on_selector_all(
+                "td[class*='d_dg_col_Name'] a",
+                "els => els.map(e => e.textContent || '')"
+            )
+        except Exception as ex:
+            logger.debug(f"⚠️ Batch text scrape failed: {ex}")
+            link_texts = []
+        logger.debug(f"🔍 Found {len(link_texts)} base assignment links")
+
+        # Normalize the scraped texts once; reused for every search term below.
+        normalized_texts = []
+        for text in link_texts:
+            text_no_emoji = self._remove_emojis(text)
+            text_normalized = re.sub(r'[-–—−]', ' ', text_no_emoji)  # Replace dashes with spaces
+            text_normalized = re.sub(r',\s*', ', ', text_normalized)  # Normalize comma spacing to ", "
+            text_normalized = re.sub(r'\s+', ' ', text_normalized).strip()  # Collapse multiple spaces
+            normalized_texts.append(text_normalized.lower())
+
         for search_term in selectors:
             try:
                 # Normalize search term: remove emojis, normalize dashes to spaces, normalize commas, collapse spaces
@@ -828,60 +1041,33 @@ class D2LProcessor:
                 search_term_normalized = re.sub(r'\s+', ' ', search_term_normalized).strip()  # Collapse multiple spaces
                 # Lower-case the search term for case-insensitive matching.
                 lower_term = search_term_normalized.lower()
-                # Debug: Check if any elements match the base selector first
-                base_elements = await page.query_selector_all("//td[contains(@class, 'd_dg_col_Name')]//a")
-                logger.debug(f"🔍 Found {len(base_elements)} base assignment links for search term '{search_term}'")
-                
-                # Debug: Log the text content of the first few base elements
-                for i, elem in enumerate(base_elements[:3]):
-                    try:
-                        text = await elem.text_content()
-                        logger.debug(f"🔍 Base element {i+1}: '{text.strip()}'")
-                    except:
-                        logger.debug(f"🔍 Base element {i+1}: Could not get text")
-                
-                # Try a simpler approach: search through all elements manually
-                for elem in base_elements:
+
+                # EXACT MATCH ONLY after normalization - no partial matching to avoid confusion between similar assignments
+                for i, text_normalized_lower in enumerate(normalized_texts):
+                    if lower_term != text_normalized_lower:
+                        continue
+                    logger.debug(f"✅ Found exact match after normalization: '{link_texts[i].strip()}'")
+                    # Only now fetch element handles, and only for the match.
+                    elements = await page.query_selector_all("td[class*='d_dg_col_Name'] a")
+                    if i >= len(elements):
+                        logger.debug("⚠️ Link list changed between scrape and handle fetch")
+                        break
+                    elem = elements[i]
+                    # Get the parent row using closest('tr')
                     try:
-                        text = await elem.text_content()
-                        if text:
-                            # Normalize webpage text: remove emojis, normalize dashes to spaces, normalize commas, collapse spaces
-                            text_no_emoji = self._remove_emojis(text)
-                            text_normalized = re.sub(r'[-–—−]', ' ', text_no_emoji)  # Replace dashes with spaces
-                            text_normalized = re.sub(r',\s*', ', ', text_normalized)  # Normalize comma spacing to ", "
-                            text_normalized = re.sub(r'\s+', ' ', text_normalized).strip()  # Collapse multiple spaces
-                            text_normalized_lower = text_normalized.lower()
-                            
-                            # EXACT MATCH ONLY after normalization - no partial matching to avoid confusion between similar assignments
-                            if lower_term == text_normalized_lower:
-                                logger.debug(f"✅ Found exact match after normalization: '{text.strip()}'")
-                                match_found = True
-                            else:
-                                logger.debug(f"⚠️ No exact match: search='{lower_term}' vs webpage='{text_normalized_lower}'")
-                                match_found = False
-                            
-                            if match_found:
-                                # Get the parent row using XPath
-                                try:
-                                    row = await elem.evaluate_handle("element => element.closest('tr')")
-                                    if row:
-                                        logger.info(f"✅ Assignment row found using search term '{search_term}'.")
-                                        return row
-                                except Exception as ex:
-                                    logger.debug(f"⚠️ Exception getting parent row: {ex}")
-                                    # Try alternative approach
-                                    try:
-                                        row = await elem.evaluate_handle("element => element.parentElement.closest('tr')")
-                                        if row:
-                                            logger.info(f"✅ Assignment row found using search term '{search_term}'.")
-                                            return row
-                                    except Exception as ex2:
-                                        logger.debug(f"⚠️ Alternative approach also failed: {ex2}")
-                                        continue
+                        row = await elem.evaluate_handle("element => element.closest('tr')")
                     except Exception as ex:
-                        logger.debug(f"⚠️ Exception checking element: {ex}")
-                        continue
-                
+                        logger.debug(f"⚠️ Exception getting parent row: {ex}")
+                        # Try alternative approach
+                        try:
+                            row = await elem.evaluate_handle("element => element.parentElement.closest('tr')")
+                        except Exception as ex2:
+                            logger.debug(f"⚠️ Alternative approach also failed: {ex2}")
+                            row = None
+                    if row:
+                        logger.info(f"✅ Assignment row found using search term '{search_term}'.")
+                        return row
+
                 # Fallback to original XPath if manual search fails
                 # Note: XPath doesn't support emoji removal easily, so we'll rely on manual search above
                 xpath = (